@@ -1,9 +1,141 @@
 """AutoDocs - Self-documenting breakthrough documentation for SynapseScanner v1.4.0"""
+import bisect
+import io
 import os
 import re
+import shutil
+import tempfile
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from statistics import fmean
+from typing import List, Dict, Optional, Any, Sequence, TextIO, Tuple, Union
+
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_DASH = re.compile(r'[-\s]+')
+_FIRST_H2 = re.compile(rb'\r?\n## ')
+_ENTRY_SPLIT = re.compile(r'(?m)^(?=### )')
+
+# Per-pattern content used in generated docs
+_PATTERN_EXPLANATIONS = {
+    "Quantum breakthrough": (
+        "This breakthrough leverages quantum mechanical phenomena that were previously "
+        "only accessible in specialized laboratories. The suggested experiment makes "
+        "quantum effects visible using inexpensive, readily available components."
+    ),
+    "Metamaterial lens": (
+        "Negative-index metamaterials were once theoretical constructs. This approach "
+        "demonstrates the effect using everyday materials, bridging the gap between "
+        "theoretical physics and hands-on experimentation."
+    ),
+    "Temporal periodicity": (
+        "Time crystals represent a new phase of matter. This simple analog demonstrates "
+        "the core concept of discrete time-translation symmetry breaking in an accessible way."
+    ),
+    "AI physics": (
+        "Machine learning is revolutionizing how we discover physical laws. This approach "
+        "shows how neural networks can rediscover classical mechanics from raw data."
+    ),
+}
+
+_SHOPPING_LISTS = {
+    "Quantum breakthrough": (
+        ("Polarizing filters (2x)", "$10"),
+        ("Laser pointer (red)", "$15"),
+        ("Cardboard/3D printed mounts", "$5"),
+    ),
+    "Metamaterial lens": (
+        ("Microscope slides (pack of 10)", "$8"),
+        ("Index matching oil", "$10"),
+        ("Laser pointer", "$15"),
+    ),
+    "Temporal periodicity": (
+        ("555 timer IC", "$0.50"),
+        ("LED (any color)", "$0.20"),
+        ("Resistors & capacitors", "$2"),
+        ("Breadboard", "$5"),
+    ),
+    "AI physics": (
+        ("Laptop with Python", "$0 (existing)"),
+        ("Webcam (optional)", "$0 (phone works)"),
+    ),
+}
+
+_IMPLEMENTATION_STEPS = {
+    "Quantum breakthrough": (
+        "Set up laser pointer on stable surface",
+        "Place first polarizer in beam path",
+        "Add second polarizer and rotate 90° (beam should extinguish)",
+        "Insert third polarizer at 45° between them (beam reappears!)",
+        "Document results and compare with theoretical predictions",
+    ),
+    "Metamaterial lens": (
+        "Stack microscope slides with index-matching oil between layers",
+        "Shine laser through the stack at various angles",
+        "Observe negative refraction (beam bends 'wrong' way)",
+        "Measure angles and calculate effective refractive index",
+    ),
+    "Temporal periodicity": (
+        "Build 555 timer circuit in astable mode (1 Hz)",
+        "Connect LED output",
+        "Observe the discrete time-symmetry breaking",
+        "Compare with theoretical time-crystal models",
+    ),
+    "AI physics": (
+        "Set up pendulum with position tracking (webcam or sensor)",
+        "Collect motion data for 100+ swings",
+        "Train small neural network (3-layer MLP)",
+        "Compare network predictions with Newtonian physics",
+        "Analyze what the network 'learned' about mechanics",
+    ),
+}
+
+# Star ratings for connection strength, indexed by strength // 2
+_STARS = tuple("⭐" * i + "☆" * (5 - i) for i in range(6))
+
+# Confidence labels indexed by bisect over average connection strength
+_CONF_BUCKETS = (3, 5, 7)
+_CONF_LABELS = (
+    "⭐⭐☆☆☆ (Low)",
+    "⭐⭐⭐☆☆ (Medium)",
+    "⭐⭐⭐⭐☆ (High)",
+    "⭐⭐⭐⭐⭐ (Very High)",
+)
+
+# Pattern-name keyword -> base tags, checked against the lowercased name in order
+_AI_TAGS = ("machine-learning", "physics", "AI")
+_TAG_RULES = (
+    ("quantum", ("quantum", "physics", "optics")),
+    ("material", ("metamaterials", "optics", "physics")),
+    ("temporal", ("time-crystals", "condensed-matter", "physics")),
+    ("time", ("time-crystals", "condensed-matter", "physics")),
+    ("neural", _AI_TAGS),
+)
+
+_TIME_ESTIMATES = {
+    "Easy": "1-2 hours",
+    "Medium": "Half day",
+    "Research": "1-2 days",
+}
+
+_DEFAULT_EXPLANATION = "This breakthrough represents a significant finding in cross-disciplinary research."
+_DEFAULT_STEPS = ("See full documentation for detailed steps.",)
+
+
+# Markdown table rows, bound once so per-paper loops skip the attribute lookup
+_EVIDENCE_ROW = "| {title} | {source} | {insight} | [Link]({url}) |\n".format
+_REPORT_ROW = "| {title} | {source} | {year} | {citations} |\n".format
+
+
+def _truncate(text: str, width: int) -> str:
+    """Cut text to width characters, marking the cut with an ellipsis."""
+    return text if len(text) <= width else text[:width] + "..."
+
+
+@lru_cache(maxsize=256)
+def _slugify(text: str) -> str:
+    """Convert text to URL-friendly slug."""
+    return _SLUG_DASH.sub('-', _SLUG_STRIP.sub('', text.lower().strip()))[:50]
 
 
 class BreakthroughDocumenter:
@@ -18,6 +150,7 @@ class BreakthroughDocumenter:
         self.docs_dir = self.repo_path / "docs"
         self.readme_path = self.repo_path / "README.md"
         self.breakthrough_log_path = self.docs_dir / "BREAKTHROUGHS.md"
+        self._log_fh: Optional[TextIO] = None  # append handle, opened on first log write
         
         # Ensure docs directory exists
         self.docs_dir.mkdir(exist_ok=True)
@@ -28,7 +161,8 @@ class BreakthroughDocumenter:
         papers: List[Any],
         connections: List[Any],
         ai_summary: Optional[Dict] = None,
-        query: str = ""
+        query: str = "",
+        now: Optional[datetime] = None
     ) -> str:
         """
         Creates comprehensive markdown documentation for a breakthrough.
@@ -39,129 +173,149 @@ class BreakthroughDocumenter:
             connections: List of cross-source connections
             ai_summary: Optional AI-generated summary dict
             query: Original search query
+            now: Discovery time; pass the same value to the save/log/README
+                calls so all outputs agree (defaults to the current time)
             
         Returns:
             Markdown string with full documentation
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        date_slug = datetime.now().strftime("%Y-%m-%d")
+        timestamp = (now or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
         
         pattern_name = pattern.get("pattern", "Unknown Breakthrough")
         pattern_slug = self._slugify(pattern_name)
         
         # Build document
-        lines = [
-            f"# Breakthrough: {pattern_name}",
-            "",
-            f"**Discovered:** {timestamp}",
-            f"**Query:** {query or 'N/A'}",
-            f"**Sources:** {self._get_sources_list(papers)}",
-            f"**Confidence:** {self._calculate_confidence(connections)}",
-            "",
-            "## The Breakthrough",
-            "",
-            f"{pattern.get('hint', 'No description available.')}",
-            "",
-        ]
+        buf = io.StringIO()
+        buf.write(
+            f"# Breakthrough: {pattern_name}\n"
+            "\n"
+            f"**Discovered:** {timestamp}\n"
+            f"**Query:** {query or 'N/A'}\n"
+            f"**Sources:** {self._get_sources_list(papers)}\n"
+            f"**Confidence:** {self._calculate_confidence(connections)}\n"
+            "\n"
+            "## The Breakthrough\n"
+            "\n"
+            f"{pattern.get('hint', 'No description available.')}\n"
+            "\n"
+        )
         
         # Why It Matters section
-        lines.extend([
-            "## Why It Matters",
-            "",
-        ])
+        buf.write("## Why It Matters\n\n")
         
         if ai_summary and ai_summary.get("tldr"):
-            lines.append(f"{ai_summary['tldr']}")
-            lines.append("")
+            buf.write(f"{ai_summary['tldr']}\n\n")
             if ai_summary.get("insights"):
-                lines.append("### Key Insights")
-                lines.append("")
+                buf.write("### Key Insights\n\n")
                 for insight in ai_summary["insights"][:3]:
-                    lines.append(f"- {insight}")
-                lines.append("")
+                    buf.write(f"- {insight}\n")
+                buf.write("\n")
         else:
-            lines.append(self._get_pattern_explanation(pattern_name))
-            lines.append("")
+            buf.write(f"{self._get_pattern_explanation(pattern_name)}\n\n")
         
         # Supporting Evidence
         if papers:
-            lines.extend([
-                "## Supporting Evidence",
-                "",
-                "| Paper | Source | Key Insight | Link |",
-                "|-------|--------|-------------|------|",
-            ])
+            buf.write(
+                "## Supporting Evidence\n"
+                "\n"
+                "| Paper | Source | Key Insight | Link |\n"
+                "|-------|--------|-------------|------|\n"
+            )
             
             for paper in papers[:5]:  # Top 5 papers
-                title = paper.title[:50] + "..." if len(paper.title) > 50 else paper.title
-                source = paper.source
-                abstract = paper.abstract[:60] + "..." if len(paper.abstract) > 60 else paper.abstract
-                url = paper.url or "N/A"
-                lines.append(f"| {title} | {source} | {abstract} | [Link]({url}) |")
+                buf.write(_EVIDENCE_ROW(
+                    title=_truncate(paper.title, 50),
+                    source=paper.source,
+                    insight=_truncate(paper.abstract, 60),
+                    url=paper.url or "N/A",
+                ))
             
-            lines.append("")
+            buf.write("\n")
         
         # Cross-Source Connections
         if connections:
-            lines.extend([
-                "## Cross-Source Connections",
-                "",
-            ])
+            buf.write("## Cross-Source Connections\n\n")
             
             for conn in connections[:5]:
-                strength_emoji = "⭐" * (conn.strength // 2) + "☆" * (5 - conn.strength // 2)
-                lines.append(f"- **{conn.paper_a.source} ↔ {conn.paper_b.source}** ({strength_emoji})")
-                lines.append(f"  - {conn.reason}")
-                lines.append("")
+                strength_emoji = _STARS[min(conn.strength // 2, 5)]
+                buf.write(f"- **{conn.paper_a.source} ↔ {conn.paper_b.source}** ({strength_emoji})\n")
+                buf.write(f"  - {conn.reason}\n\n")
         
         # Implementation
-        lines.extend([
-            "## Implementation",
-            "",
-            f"**Cost:** {pattern.get('cost', 'Unknown')}",
-            f"**Difficulty:** {pattern.get('difficulty', 'Unknown')}",
-            f"**Estimated Time:** {self._estimate_time(pattern.get('difficulty', 'Unknown'))}",
-            "",
-        ])
+        buf.write(
+            "## Implementation\n"
+            "\n"
+            f"**Cost:** {pattern.get('cost', 'Unknown')}\n"
+            f"**Difficulty:** {pattern.get('difficulty', 'Unknown')}\n"
+            f"**Estimated Time:** {self._estimate_time(pattern.get('difficulty', 'Unknown'))}\n"
+            "\n"
+        )
         
         # Shopping list based on pattern type
         shopping_list = self._get_shopping_list(pattern_name)
         if shopping_list:
-            lines.extend([
-                "### Shopping List",
-                "",
-            ])
+            buf.write("### Shopping List\n\n")
             for item, cost in shopping_list:
-                lines.append(f"- [ ] {item} ({cost})")
-            lines.append("")
+                buf.write(f"- [ ] {item} ({cost})\n")
+            buf.write("\n")
         
         # Step-by-step
         steps = self._get_implementation_steps(pattern_name)
         if steps:
-            lines.extend([
-                "### Step-by-Step",
-                "",
-            ])
+            buf.write("### Step-by-Step\n\n")
             for i, step in enumerate(steps, 1):
-                lines.append(f"{i}. {step}")
-            lines.append("")
+                buf.write(f"{i}. {step}\n")
+            buf.write("\n")
         
         # Tags
         tags = self._generate_tags(pattern_name, papers)
-        lines.extend([
-            "## Tags",
-            "",
-            " ".join([f"#{tag}" for tag in tags]),
-            "",
-            "---",
-            "",
-            f"*Generated by SynapseScanner v1.4.0*",
-            "",
-        ])
+        buf.write(
+            "## Tags\n"
+            "\n"
+            f"{' '.join(f'#{tag}' for tag in tags)}\n"
+            "\n"
+            "---\n"
+            "\n"
+            "*Generated by SynapseScanner v1.4.0*\n"
+        )
         
-        return "\n".join(lines)
+        return buf.getvalue()
     
-    def update_readme(self, pattern: Dict[str, Any], doc_content: str) -> bool:
+    def emit_breakthrough(
+        self,
+        pattern: Dict[str, Any],
+        papers: List[Any],
+        connections: List[Any],
+        ai_summary: Optional[Dict] = None,
+        query: str = "",
+        update_readme: bool = False,
+        breakthrough_log: bool = False
+    ) -> Optional[Path]:
+        """
+        Generates and writes all outputs for one breakthrough as a batch.
+        
+        The doc is rendered once and saved to the docs directory; the same
+        content and timestamp then feed the optional breakthrough log entry
+        (appended through the cached log handle) and the optional README
+        update (a separate rewrite of README.md).
+        
+        Returns:
+            Path of the saved breakthrough doc, or None if saving failed
+        """
+        now = datetime.now()
+        doc_content = self.generate_breakthrough_doc(
+            pattern, papers, connections, ai_summary=ai_summary, query=query, now=now
+        )
+        
+        doc_path = self.save_breakthrough_doc(pattern, doc_content, now)
+        if breakthrough_log:
+            self.maintain_breakthrough_log(pattern, doc_content, now)
+        if update_readme:
+            self.update_readme(pattern, doc_content, now)
+        return doc_path
+    
+    def update_readme(self, pattern: Dict[str, Any], doc_content: str,
+                      now: Optional[datetime] = None) -> bool:
         """
         Updates README.md with latest breakthrough section.
         Inserts after "## Latest Discoveries" header.
@@ -172,22 +326,28 @@ class BreakthroughDocumenter:
             return False
         
         try:
-            content = self.readme_path.read_text(encoding='utf-8')
+            raw = self.readme_path.read_bytes()
+            view = memoryview(raw)
+            # Keep the file's existing line endings for the text we add
+            eol = "\r\n" if b"\r\n" in raw else "\n"
             
             # Find or create the Latest Discoveries section
             section_start = "## Latest Discoveries"
             section_marker_start = "<!-- SYNAPSESCANNER-BREAKTHROUGHS-START -->"
             section_marker_end = "<!-- SYNAPSESCANNER-BREAKTHROUGHS-END -->"
+            marker_start = section_marker_start.encode('utf-8')
+            marker_end = section_marker_end.encode('utf-8')
             
             # Create new entry
-            new_entry = self._format_readme_entry(pattern, doc_content)
+            new_entry = self._format_readme_entry(pattern, doc_content, now)
             
-            if section_marker_start in content and section_marker_end in content:
+            pieces: Tuple[Union[memoryview, str], ...]
+            if marker_start in raw and marker_end in raw:
                 # Update existing section
-                start_idx = content.find(section_marker_start) + len(section_marker_start)
-                end_idx = content.find(section_marker_end)
+                start_idx = raw.find(marker_start) + len(marker_start)
+                end_idx = raw.find(marker_end)
                 
-                existing_entries = content[start_idx:end_idx]
+                existing_entries = bytes(view[start_idx:end_idx]).decode('utf-8').replace("\r\n", "\n")
                 
                 # Parse existing entries and keep only last 4 (plus new = 5)
                 entries = self._parse_existing_entries(existing_entries)
@@ -198,24 +358,33 @@ class BreakthroughDocumenter:
                 new_section_content = "\n\n---\n\n".join(entries)
                 
                 # Replace in content
-                new_content = (
-                    content[:start_idx] + 
-                    "\n\n" + new_section_content + "\n\n" +
-                    content[end_idx:]
-                )
+                pieces = (view[:start_idx], f"\n\n{new_section_content}\n\n", view[end_idx:])
             else:
                 # Create new section
                 section_content = f"\n{section_start}\n\n{section_marker_start}\n\n{new_entry}\n\n{section_marker_end}\n\n"
                 
                 # Insert before first ## section or at end
-                first_header = re.search(r'\n## ', content)
+                first_header = _FIRST_H2.search(raw)
                 if first_header:
                     insert_pos = first_header.start()
-                    new_content = content[:insert_pos] + section_content + content[insert_pos:]
+                    pieces = (view[:insert_pos], section_content, view[insert_pos:])
                 else:
-                    new_content = content + "\n" + section_content
+                    pieces = (view, "\n" + section_content)
+            
+            # Stream head, new section and tail into a temp file beside README,
+            # then swap it in with README's permissions; never leave it behind
+            tmp = tempfile.NamedTemporaryFile(dir=self.readme_path.parent, prefix=".README.",
+                                              suffix=".tmp", delete=False)
+            try:
+                with tmp as f:
+                    for piece in pieces:
+                        f.write(piece.replace("\n", eol).encode('utf-8') if isinstance(piece, str) else piece)
+                shutil.copymode(self.readme_path, tmp.name)
+                os.replace(tmp.name, self.readme_path)
+            except BaseException:
+                os.unlink(tmp.name)
+                raise
             
-            self.readme_path.write_text(new_content, encoding='utf-8')
             print(f"[OK] Updated README.md with new breakthrough")
             return True
             
@@ -223,20 +392,16 @@ class BreakthroughDocumenter:
             print(f"[!] Failed to update README: {e}")
             return False
     
-    def maintain_breakthrough_log(self, pattern: Dict[str, Any], doc_content: str) -> bool:
+    def maintain_breakthrough_log(self, pattern: Dict[str, Any], doc_content: str,
+                                  now: Optional[datetime] = None) -> bool:
         """
         Appends to docs/BREAKTHROUGHS.md (chronological log of all discoveries).
         """
         try:
-            # Create header if file doesn't exist
-            if not self.breakthrough_log_path.exists():
-                header = "# SynapseScanner Breakthrough Log\n\n"
-                header += "Chronological record of all research breakthroughs discovered.\n\n"
-                header += "---\n\n"
-                self.breakthrough_log_path.write_text(header, encoding='utf-8')
+            log = self._breakthrough_log()
             
             # Append new entry
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+            timestamp = (now or datetime.now()).strftime("%Y-%m-%d %H:%M")
             pattern_name = pattern.get("pattern", "Unknown")
             
             entry = f"\n## {timestamp} - {pattern_name}\n\n"
@@ -246,8 +411,8 @@ class BreakthroughDocumenter:
             entry += f"[Full Documentation](./{self._slugify(pattern_name)}.md)\n\n"
             entry += "---\n"
             
-            with open(self.breakthrough_log_path, 'a', encoding='utf-8') as f:
-                f.write(entry)
+            log.write(entry)
+            log.flush()
             
             print(f"[OK] Appended to {self.breakthrough_log_path}")
             return True
@@ -256,10 +421,29 @@ class BreakthroughDocumenter:
             print(f"[!] Failed to update breakthrough log: {e}")
             return False
     
-    def save_breakthrough_doc(self, pattern: Dict[str, Any], doc_content: str) -> Optional[Path]:
+    def _breakthrough_log(self) -> TextIO:
+        """Return the cached append handle for the log, writing the header if new."""
+        if self._log_fh is None or self._log_fh.closed:
+            self._log_fh = open(self.breakthrough_log_path, 'a', buffering=65536, encoding='utf-8')
+            # Create header if file is new or empty
+            if os.fstat(self._log_fh.fileno()).st_size == 0:
+                header = "# SynapseScanner Breakthrough Log\n\n"
+                header += "Chronological record of all research breakthroughs discovered.\n\n"
+                header += "---\n\n"
+                self._log_fh.write(header)
+        return self._log_fh
+    
+    def close(self) -> None:
+        """Close the cached breakthrough log handle, if open."""
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
+    
+    def save_breakthrough_doc(self, pattern: Dict[str, Any], doc_content: str,
+                              now: Optional[datetime] = None) -> Optional[Path]:
         """Save full breakthrough documentation to docs/ directory."""
         try:
-            date_slug = datetime.now().strftime("%Y-%m-%d")
+            date_slug = (now or datetime.now()).strftime("%Y-%m-%d")
             pattern_slug = self._slugify(pattern.get("pattern", "breakthrough"))
             filename = f"{date_slug}-{pattern_slug}.md"
             filepath = self.docs_dir / filename
@@ -286,43 +470,43 @@ class BreakthroughDocumenter:
         try:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             
-            lines = [
-                f"# Research Report: {query}",
-                "",
-                f"**Generated:** {timestamp}",
-                f"**Papers Found:** {len(all_papers)}",
-                f"**Breakthroughs Detected:** {len(patterns)}",
-                "",
-                "## Summary",
-                "",
-            ]
+            buf = io.StringIO()
+            buf.write(
+                f"# Research Report: {query}\n"
+                "\n"
+                f"**Generated:** {timestamp}\n"
+                f"**Papers Found:** {len(all_papers)}\n"
+                f"**Breakthroughs Detected:** {len(patterns)}\n"
+                "\n"
+                "## Summary\n"
+                "\n"
+            )
             
             if patterns:
-                lines.append("### Detected Breakthroughs")
-                lines.append("")
+                buf.write("### Detected Breakthroughs\n\n")
                 for p in patterns:
-                    lines.append(f"- **{p.get('pattern')}** ({p.get('cost')}, {p.get('difficulty')})")
-                lines.append("")
+                    buf.write(f"- **{p.get('pattern')}** ({p.get('cost')}, {p.get('difficulty')})\n")
+                buf.write("\n")
             
-            lines.extend([
-                "## All Papers",
-                "",
-                "| Title | Source | Year | Citations |",
-                "|-------|--------|------|-----------|",
-            ])
+            buf.write(
+                "## All Papers\n"
+                "\n"
+                "| Title | Source | Year | Citations |\n"
+                "|-------|--------|------|-----------|\n"
+            )
             
+            write = buf.write
             for paper in all_papers:
-                year = paper.published[:4] if paper.published else "N/A"
-                citations = paper.citations or "N/A"
-                title = paper.title[:60] + "..." if len(paper.title) > 60 else paper.title
-                lines.append(f"| {title} | {paper.source} | {year} | {citations} |")
+                write(_REPORT_ROW(
+                    title=_truncate(paper.title, 60),
+                    source=paper.source,
+                    year=paper.published[:4] or "N/A",
+                    citations=paper.citations or "N/A",
+                ))
             
-            lines.append("")
-            lines.append("---")
-            lines.append("")
-            lines.append("*Generated by SynapseScanner v1.4.0*")
+            buf.write("\n---\n\n*Generated by SynapseScanner v1.4.0*")
             
-            Path(output_path).write_text("\n".join(lines), encoding='utf-8')
+            Path(output_path).write_text(buf.getvalue(), encoding='utf-8')
             print(f"[OK] Saved research report: {output_path}")
             return True
             
@@ -333,39 +517,29 @@ class BreakthroughDocumenter:
     # Helper methods
     def _slugify(self, text: str) -> str:
         """Convert text to URL-friendly slug."""
-        text = text.lower().strip()
-        text = re.sub(r'[^\w\s-]', '', text)
-        text = re.sub(r'[-\s]+', '-', text)
-        return text[:50]
+        return _slugify(text)
     
     def _get_sources_list(self, papers: List[Any]) -> str:
         """Get comma-separated list of sources."""
-        sources = list(set(p.source for p in papers if hasattr(p, 'source')))
-        return ", ".join(sources) if sources else "N/A"
+        return ", ".join(sorted({p.source for p in papers})) if papers else "N/A"
     
     def _calculate_confidence(self, connections: List[Any]) -> str:
         """Calculate confidence rating based on connections."""
         if not connections:
-            return "⭐⭐⭐☆☆ (Medium)"
+            return _CONF_LABELS[1]
         
-        avg_strength = sum(c.strength for c in connections) / len(connections)
-        if avg_strength >= 7:
-            return "⭐⭐⭐⭐⭐ (Very High)"
-        elif avg_strength >= 5:
-            return "⭐⭐⭐⭐☆ (High)"
-        elif avg_strength >= 3:
-            return "⭐⭐⭐☆☆ (Medium)"
-        else:
-            return "⭐⭐☆☆☆ (Low)"
+        avg_strength = fmean(c.strength for c in connections)
+        return _CONF_LABELS[bisect.bisect_right(_CONF_BUCKETS, avg_strength)]
     
-    def _format_readme_entry(self, pattern: Dict[str, Any], doc_content: str) -> str:
+    def _format_readme_entry(self, pattern: Dict[str, Any], doc_content: str,
+                             now: Optional[datetime] = None) -> str:
         """Format a breakthrough entry for README."""
         pattern_name = pattern.get("pattern", "Unknown")
         cost = pattern.get("cost", "Unknown")
         difficulty = pattern.get("difficulty", "Unknown")
         hint = pattern.get("hint", "")
         
-        date_str = datetime.now().strftime("%b %d, %Y")
+        date_str = (now or datetime.now()).strftime("%b %d, %Y")
         doc_filename = f"./docs/{self._slugify(pattern_name)}.md"
         
         entry = f"""### 🧪 {pattern_name} ({date_str})
@@ -387,127 +561,42 @@ See full documentation for paper links and implementation details.
     def _parse_existing_entries(self, content: str) -> List[str]:
         """Parse existing README entries."""
         entries = []
-        current_entry = []
-        
-        for line in content.split('\n'):
-            if line.startswith('### ') and current_entry:
-                entries.append('\n'.join(current_entry))
-                current_entry = [line]
-            elif line.strip() or current_entry:
-                current_entry.append(line)
-        
-        if current_entry:
-            entries.append('\n'.join(current_entry))
-        
-        return [e.strip() for e in entries if e.strip()]
+        for part in _ENTRY_SPLIT.split(content):
+            # Drop the separator update_readme puts between entries
+            entry = part.strip().removesuffix("---").rstrip()
+            if entry:
+                entries.append(entry)
+        return entries
     
     def _get_pattern_explanation(self, pattern_name: str) -> str:
         """Get explanation for a pattern type."""
-        explanations = {
-            "Quantum breakthrough": (
-                "This breakthrough leverages quantum mechanical phenomena that were previously "
-                "only accessible in specialized laboratories. The suggested experiment makes "
-                "quantum effects visible using inexpensive, readily available components."
-            ),
-            "Metamaterial lens": (
-                "Negative-index metamaterials were once theoretical constructs. This approach "
-                "demonstrates the effect using everyday materials, bridging the gap between "
-                "theoretical physics and hands-on experimentation."
-            ),
-            "Temporal periodicity": (
-                "Time crystals represent a new phase of matter. This simple analog demonstrates "
-                "the core concept of discrete time-translation symmetry breaking in an accessible way."
-            ),
-            "AI physics": (
-                "Machine learning is revolutionizing how we discover physical laws. This approach "
-                "shows how neural networks can rediscover classical mechanics from raw data."
-            ),
-        }
-        return explanations.get(pattern_name, "This breakthrough represents a significant finding in cross-disciplinary research.")
+        return _PATTERN_EXPLANATIONS.get(pattern_name, _DEFAULT_EXPLANATION)
     
-    def _get_shopping_list(self, pattern_name: str) -> List[tuple]:
+    def _get_shopping_list(self, pattern_name: str) -> Sequence[Tuple[str, str]]:
         """Get shopping list for a pattern."""
-        lists = {
-            "Quantum breakthrough": [
-                ("Polarizing filters (2x)", "$10"),
-                ("Laser pointer (red)", "$15"),
-                ("Cardboard/3D printed mounts", "$5"),
-            ],
-            "Metamaterial lens": [
-                ("Microscope slides (pack of 10)", "$8"),
-                ("Index matching oil", "$10"),
-                ("Laser pointer", "$15"),
-            ],
-            "Temporal periodicity": [
-                ("555 timer IC", "$0.50"),
-                ("LED (any color)", "$0.20"),
-                ("Resistors & capacitors", "$2"),
-                ("Breadboard", "$5"),
-            ],
-            "AI physics": [
-                ("Laptop with Python", "$0 (existing)"),
-                ("Webcam (optional)", "$0 (phone works)"),
-            ],
-        }
-        return lists.get(pattern_name, [])
+        return _SHOPPING_LISTS.get(pattern_name, ())
     
-    def _get_implementation_steps(self, pattern_name: str) -> List[str]:
+    def _get_implementation_steps(self, pattern_name: str) -> Sequence[str]:
         """Get implementation steps for a pattern."""
-        steps = {
-            "Quantum breakthrough": [
-                "Set up laser pointer on stable surface",
-                "Place first polarizer in beam path",
-                "Add second polarizer and rotate 90° (beam should extinguish)",
-                "Insert third polarizer at 45° between them (beam reappears!)",
-                "Document results and compare with theoretical predictions",
-            ],
-            "Metamaterial lens": [
-                "Stack microscope slides with index-matching oil between layers",
-                "Shine laser through the stack at various angles",
-                "Observe negative refraction (beam bends 'wrong' way)",
-                "Measure angles and calculate effective refractive index",
-            ],
-            "Temporal periodicity": [
-                "Build 555 timer circuit in astable mode (1 Hz)",
-                "Connect LED output",
-                "Observe the discrete time-symmetry breaking",
-                "Compare with theoretical time-crystal models",
-            ],
-            "AI physics": [
-                "Set up pendulum with position tracking (webcam or sensor)",
-                "Collect motion data for 100+ swings",
-                "Train small neural network (3-layer MLP)",
-                "Compare network predictions with Newtonian physics",
-                "Analyze what the network 'learned' about mechanics",
-            ],
-        }
-        return steps.get(pattern_name, ["See full documentation for detailed steps."])
+        return _IMPLEMENTATION_STEPS.get(pattern_name, _DEFAULT_STEPS)
     
     def _estimate_time(self, difficulty: str) -> str:
         """Estimate implementation time."""
-        times = {
-            "Easy": "1-2 hours",
-            "Medium": "Half day",
-            "Research": "1-2 days",
-        }
-        return times.get(difficulty, "Variable")
+        return _TIME_ESTIMATES.get(difficulty, "Variable")
     
     def _generate_tags(self, pattern_name: str, papers: List[Any]) -> List[str]:
         """Generate tags for a breakthrough."""
-        tags = []
-        
-        # Base tags from pattern
-        if "quantum" in pattern_name.lower():
-            tags.extend(["quantum", "physics", "optics"])
-        elif "material" in pattern_name.lower():
-            tags.extend(["metamaterials", "optics", "physics"])
-        elif "temporal" in pattern_name.lower() or "time" in pattern_name.lower():
-            tags.extend(["time-crystals", "condensed-matter", "physics"])
-        elif "AI" in pattern_name or "neural" in pattern_name:
-            tags.extend(["machine-learning", "physics", "AI"])
-        
-        # Difficulty tag
-        tags.append("breakthrough")
-        tags.append("experiment")
+        # Base tags from pattern; first matching rule wins
+        name_lower = pattern_name.lower()
+        base: Sequence[str] = ()
+        for keyword, rule_tags in _TAG_RULES:
+            if keyword in name_lower:
+                base = rule_tags
+                break
+        else:
+            # Case-sensitive so "AI" doesn't match inside ordinary words
+            if "AI" in pattern_name:
+                base = _AI_TAGS
         
-        return list(set(tags))
+        # Deduplicate, keeping a stable order
+        return list(dict.fromkeys((*base, "breakthrough", "experiment")))
@@ -2,11 +2,18 @@
 import sqlite3
 import json
 import os
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 from .sources import Paper
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class Cache:
     """SQLite cache for paper data and search history."""
@@ -20,11 +27,34 @@ class Cache:
             db_path = str(cache_dir / "cache.db")
         
         self.db_path = db_path
+        # One long-lived connection shared by all calls; autocommit mode, with
+        # explicit BEGIN for multi-statement writes. The lock serializes access.
+        self._lock = threading.Lock()
+        self._conn = self._connect()
         self._init_db()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection tuned for bulk writes and mmap'd reads."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        # Per-connection settings; journal_mode=WAL persists in the file itself
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # Read-mostly and small: serve pages from an mmap and a larger page cache
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.row_factory = sqlite3.Row
+        return conn
+    
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+    
     def _init_db(self):
         """Initialize database tables."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS papers (
                     id TEXT NOT NULL,
@@ -54,6 +84,16 @@ class Cache:
                 )
             """)
             
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS query_papers (
+                    query_id INTEGER NOT NULL,
+                    paper_id TEXT NOT NULL,
+                    paper_source TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    PRIMARY KEY (query_id, paper_id, paper_source)
+                )
+            """)
+            
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_papers_source 
                 ON papers(source)
@@ -64,32 +104,40 @@ class Cache:
                 ON queries(timestamp)
             """)
             
-            conn.commit()
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_queries_lookup 
+                ON queries(query, source, timestamp DESC)
+            """)
     
     def save_papers(self, papers: List[Paper]):
         """Save papers to cache."""
-        with sqlite3.connect(self.db_path) as conn:
-            for paper in papers:
-                conn.execute("""
-                    INSERT OR REPLACE INTO papers
-                    (id, source, title, authors, abstract, url, pdf_url, 
-                     published, citations, references_data, keywords, fetched_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    paper.id,
-                    paper.source,
-                    paper.title,
-                    json.dumps(paper.authors),
-                    paper.abstract,
-                    paper.url,
-                    paper.pdf_url,
-                    paper.published,
-                    paper.citations,
-                    json.dumps(paper.references),
-                    json.dumps(paper.keywords),
-                    datetime.now().isoformat()
-                ))
-            conn.commit()
+        now = datetime.now().isoformat()
+        rows = [
+            (
+                paper.id,
+                paper.source,
+                paper.title,
+                json.dumps(paper.authors),
+                paper.abstract,
+                paper.url,
+                paper.pdf_url,
+                paper.published,
+                paper.citations,
+                json.dumps(paper.references),
+                json.dumps(paper.keywords),
+                now,
+            )
+            for paper in papers
+        ]
+        
+        with self._lock, self._conn as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany("""
+                INSERT OR REPLACE INTO papers
+                (id, source, title, authors, abstract, url, pdf_url, 
+                 published, citations, references_data, keywords, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
     
     def get_cached(self, query: str, source: str, max_age_hours: int = 24) -> Optional[List[Paper]]:
         """Get cached papers for a query if not expired.
@@ -102,49 +150,55 @@ class Cache:
         Returns:
             List of papers if cache hit, None otherwise
         """
-        with sqlite3.connect(self.db_path) as conn:
-            # Check if we have a recent query entry
-            cutoff = (datetime.now() - timedelta(hours=max_age_hours)).isoformat()
-            
+        cutoff = (datetime.now() - timedelta(hours=max_age_hours)).isoformat()
+        
+        with self._lock, self._conn as conn:
+            # Papers linked to the most recent matching query, in fetch order
             cursor = conn.execute("""
-                SELECT id FROM queries
-                WHERE query = ? AND source = ? AND timestamp > ?
-                ORDER BY timestamp DESC LIMIT 1
+                SELECT p.* FROM query_papers qp
+                JOIN papers p ON p.id = qp.paper_id AND p.source = qp.paper_source
+                WHERE qp.query_id = (
+                    SELECT id FROM queries
+                    WHERE query = ? AND source = ? AND timestamp > ?
+                    ORDER BY timestamp DESC LIMIT 1
+                )
+                ORDER BY qp.position
             """, (query, source, cutoff))
             
-            if not cursor.fetchone():
-                return None
-            
-            # Get papers for this query - simplified: return recent papers from this source
-            cursor = conn.execute("""
-                SELECT * FROM papers
-                WHERE source = ? AND fetched_at > ?
-                ORDER BY fetched_at DESC
-            """, (source, cutoff))
-            
             rows = cursor.fetchall()
             if not rows:
                 return None
             
-            papers = []
-            for row in rows:
-                paper = self._row_to_paper(row)
-                papers.append(paper)
-            
-            return papers
+            return [self._row_to_paper(row) for row in rows]
     
-    def record_query(self, query: str, source: str, max_results: int, result_count: int):
-        """Record a query in the history."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
+    def record_query(self, query: str, source: str, max_results: int, result_count: int,
+                     papers: Optional[List[Paper]] = None):
+        """Record a query in the history.
+        
+        Args:
+            query: Search query string
+            source: Source name
+            max_results: Requested result limit
+            result_count: Number of results returned
+            papers: Papers returned by the query; linked so get_cached can serve them
+        """
+        with self._lock, self._conn as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.execute("""
                 INSERT INTO queries (query, source, max_results, result_count, timestamp)
                 VALUES (?, ?, ?, ?, ?)
             """, (query, source, max_results, result_count, datetime.now().isoformat()))
-            conn.commit()
+            
+            if papers:
+                query_id = cursor.lastrowid
+                conn.executemany("""
+                    INSERT OR IGNORE INTO query_papers (query_id, paper_id, paper_source, position)
+                    VALUES (?, ?, ?, ?)
+                """, [(query_id, p.id, p.source, i) for i, p in enumerate(papers)])
     
     def get_paper_by_id(self, paper_id: str, source: str) -> Optional[Paper]:
         """Get a specific paper by ID and source."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute(
                 "SELECT * FROM papers WHERE id = ? AND source = ?",
                 (paper_id, source)
@@ -154,33 +208,59 @@ class Cache:
                 return self._row_to_paper(row)
             return None
     
-    def get_all_papers(self, limit: int = 1000) -> List[Paper]:
-        """Get all cached papers."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
+    def iter_papers(self, limit: int = 1000) -> Iterator[Paper]:
+        """Iterate cached papers, newest first, decoding them lazily.
+        
+        Rows are pulled in batches; the lock is only held while fetching,
+        so callers may read from the cache between iterations or stop early.
+        Callers must not write to the cache (save_papers, record_query,
+        clear_cache) or close it while an iterator is open: the read stays
+        open on the shared connection until the iterator is exhausted or
+        closed. Use get_all_papers to take a snapshot instead.
+        """
+        with self._lock:
+            cursor = self._conn.execute(
                 "SELECT * FROM papers ORDER BY fetched_at DESC LIMIT ?",
                 (limit,)
             )
-            return [self._row_to_paper(row) for row in cursor.fetchall()]
+        cursor.arraysize = 256
+        
+        try:
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany()
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._row_to_paper(row)
+        finally:
+            # Runs on exhaustion, on generator close() and when an abandoned
+            # generator is collected, so the read never pins the WAL
+            with self._lock:
+                cursor.close()
+    
+    def get_all_papers(self, limit: int = 1000) -> List[Paper]:
+        """Get all cached papers."""
+        return list(self.iter_papers(limit))
     
     def clear_cache(self):
         """Clear all cached data."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM query_papers")
             conn.execute("DELETE FROM papers")
             conn.execute("DELETE FROM queries")
-            conn.commit()
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        with sqlite3.connect(self.db_path) as conn:
-            paper_count = conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
-            query_count = conn.execute("SELECT COUNT(*) FROM queries").fetchone()[0]
-            
-            # Count by source
+        with self._lock, self._conn as conn:
+            # Count by source; source is NOT NULL, so the buckets sum to the total
             cursor = conn.execute("""
                 SELECT source, COUNT(*) FROM papers GROUP BY source
             """)
-            by_source = {row[0]: row[1] for row in cursor.fetchall()}
+            by_source = {source: count for source, count in cursor}
+            paper_count = sum(by_source.values())
+            query_count = conn.execute("SELECT COUNT(*) FROM queries").fetchone()[0]
             
             return {
                 "total_papers": paper_count,
@@ -189,20 +269,20 @@ class Cache:
                 "db_path": self.db_path
             }
     
-    def _row_to_paper(self, row) -> Paper:
+    def _row_to_paper(self, row: sqlite3.Row) -> Paper:
         """Convert database row to Paper object."""
         return Paper(
-            id=row[0],
-            source=row[1],
-            title=row[2],
-            authors=json.loads(row[3]) if row[3] else [],
-            abstract=row[4] or "",
-            url=row[5] or "",
-            pdf_url=row[6] or "",
-            published=row[7] or "",
-            citations=row[8] or 0,
-            references=json.loads(row[9]) if row[9] else [],
-            keywords=json.loads(row[10]) if row[10] else []
+            id=row["id"],
+            source=row["source"],
+            title=row["title"],
+            authors=_json_loads(row["authors"]) if row["authors"] else [],
+            abstract=row["abstract"] or "",
+            url=row["url"] or "",
+            pdf_url=row["pdf_url"] or "",
+            published=row["published"] or "",
+            citations=row["citations"] or 0,
+            references=_json_loads(row["references_data"]) if row["references_data"] else [],
+            keywords=_json_loads(row["keywords"]) if row["keywords"] else []
         )
 
 
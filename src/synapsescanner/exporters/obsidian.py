@@ -1,21 +1,31 @@
 """Obsidian markdown exporter for SynapseScanner."""
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 from . import BaseExporter
 from ..sources import Paper, Connection
 
+# Filename and tag sanitizers, compiled once
+_UNSAFE_RE = re.compile(r'[^\w\s-]')
+_COLLAPSE_RE = re.compile(r'[-\s]+')
+_TAG_RE = re.compile(r'[^\w]')
+
 
 class ObsidianExporter(BaseExporter):
     """Export papers to Obsidian-compatible markdown with YAML frontmatter."""
     
+    # Backslashes and double quotes escaped in a single pass
+    _YAML_ESCAPE = str.maketrans({'"': '\\"', '\\': '\\\\'})
+    
     def __init__(self, output_path: Optional[str] = None):
         if output_path is None:
             # Default to ~/SynapseNotes
             output_path = os.path.expanduser("~/SynapseNotes")
         super().__init__(output_path)
+        self._output_dir = Path(output_path)
     
     def export(self, papers: List[Paper], connections: Optional[List[Connection]] = None,
                query: str = "") -> str:
@@ -23,32 +33,33 @@ class ObsidianExporter(BaseExporter):
         
         Returns summary of exported files.
         """
-        Path(self.output_path).mkdir(parents=True, exist_ok=True)
+        self._output_dir.mkdir(parents=True, exist_ok=True)
         
         exported = []
+        # Rendered notes by path; a later paper with the same filename replaces an earlier one
+        files = {}
         
         for paper in papers:
             filename = self._sanitize_filename(paper.title)
-            filepath = os.path.join(self.output_path, f"{filename}.md")
-            
-            content = self._format_paper(paper, query)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
+            filepath = self._output_dir / f"{filename}.md"
+            files[filepath] = self._format_paper(paper, query).encode('utf-8')
             exported.append(filename)
         
         # Export connections if any
         if connections:
             conn_filename = f"connections_{self._sanitize_filename(query) or 'all'}"
-            conn_filepath = os.path.join(self.output_path, f"{conn_filename}.md")
+            conn_filepath = self._output_dir / f"{conn_filename}.md"
             
             conn_content = self._format_connections(connections, query)
-            with open(conn_filepath, 'w', encoding='utf-8') as f:
-                f.write(conn_content)
+            files[conn_filepath] = conn_content.encode('utf-8')
             
             exported.append(conn_filename)
         
+        # Writes are I/O-bound and release the GIL, so overlap them across threads
+        if files:
+            with ThreadPoolExecutor(max_workers=min(32, len(files))) as pool:
+                list(pool.map(lambda item: item[0].write_bytes(item[1]), files.items()))
+        
         return f"Exported {len(exported)} files to {self.output_path}"
     
     def export_to_string(self, papers: List[Paper], connections: Optional[List[Connection]] = None,
@@ -67,87 +78,81 @@ class ObsidianExporter(BaseExporter):
     def _format_paper(self, paper: Paper, query: str) -> str:
         """Format a single paper as Obsidian markdown with YAML frontmatter."""
         # Extract tags from keywords
-        tags = paper.keywords[:10] if paper.keywords else []
+        tags = list(paper.keywords[:10])
+        seen = set(tags)
         
         # Add query as a tag if provided
         if query:
-            query_tag = re.sub(r'[^\w]', '_', query.lower())
-            if query_tag not in tags:
+            query_tag = _TAG_RE.sub('_', query.lower())
+            if query_tag not in seen:
                 tags.append(query_tag)
+                seen.add(query_tag)
         
         # Ensure source is a tag
-        if paper.source and paper.source not in tags:
+        if paper.source and paper.source not in seen:
             tags.append(paper.source)
         
-        # Build YAML frontmatter
-        lines = ["---"]
-        lines.append(f'title: "{self._escape_yaml(paper.title)}"')
-        lines.append(f'authors: {paper.authors}')
-        lines.append(f'source: {paper.source}')
-        lines.append(f'paper_id: "{paper.id}"')
-        lines.append(f'url: {paper.url}')
-        if paper.pdf_url:
-            lines.append(f'pdf_url: {paper.pdf_url}')
-        if paper.published:
-            lines.append(f'published: {paper.published}')
-        if paper.citations:
-            lines.append(f'citations: {paper.citations}')
-        lines.append(f'tags: {tags}')
-        lines.append(f'fetched: {datetime.now().strftime("%Y-%m-%d")}')
-        lines.append("---")
-        lines.append("")
-        
-        # Abstract
-        if paper.abstract:
-            lines.append("## Abstract")
-            lines.append("")
-            lines.append(paper.abstract)
-            lines.append("")
-        
-        # Links section
-        lines.append("## Links")
-        lines.append(f"- [Source]({paper.url})")
-        if paper.pdf_url:
-            lines.append(f"- [PDF]({paper.pdf_url})")
-        lines.append("")
-        
-        # Notes section (empty for user to fill)
-        lines.append("## Notes")
-        lines.append("")
-        lines.append("_Add your notes here..._")
-        lines.append("")
-        
-        return "\n".join(lines)
+        # Optional fields render as empty strings when absent
+        pdf_url = f'pdf_url: {paper.pdf_url}\n' if paper.pdf_url else ''
+        published = f'published: {paper.published}\n' if paper.published else ''
+        citations = f'citations: {paper.citations}\n' if paper.citations else ''
+        abstract = f'## Abstract\n\n{paper.abstract}\n\n' if paper.abstract else ''
+        pdf_link = f'- [PDF]({paper.pdf_url})\n' if paper.pdf_url else ''
+        
+        # YAML frontmatter, abstract, links, then an empty notes section for the user
+        return (
+            f'---\n'
+            f'title: "{self._escape_yaml(paper.title)}"\n'
+            f'authors: {paper.authors}\n'
+            f'source: {paper.source}\n'
+            f'paper_id: "{paper.id}"\n'
+            f'url: {paper.url}\n'
+            f'{pdf_url}{published}{citations}'
+            f'tags: {tags}\n'
+            f'fetched: {datetime.now().strftime("%Y-%m-%d")}\n'
+            f'---\n'
+            f'\n'
+            f'{abstract}'
+            f'## Links\n'
+            f'- [Source]({paper.url})\n'
+            f'{pdf_link}'
+            f'\n'
+            f'## Notes\n'
+            f'\n'
+            f'_Add your notes here..._\n'
+        )
     
     def _format_connections(self, connections: List[Connection], query: str) -> str:
         """Format connections as markdown."""
-        lines = ["---"]
-        lines.append(f'title: "Hidden Connections - {self._escape_yaml(query) or "Research"}"')
-        lines.append(f'type: connections')
-        lines.append(f'fetched: {datetime.now().strftime("%Y-%m-%d")}')
-        lines.append("---")
-        lines.append("")
-        lines.append("# Hidden Connections")
-        lines.append("")
-        
-        for conn in connections:
-            lines.append(f"## {conn.paper_a.title} ↔ {conn.paper_b.title}")
-            lines.append("")
-            lines.append(f"**Strength:** {'★' * conn.strength}{'☆' * (10 - conn.strength)}")
-            lines.append("")
-            lines.append(f"**Reason:** {conn.reason}")
-            lines.append("")
-            lines.append(f"- [{conn.paper_a.title}]({self._sanitize_filename(conn.paper_a.title)}.md)")
-            lines.append(f"- [{conn.paper_b.title}]({self._sanitize_filename(conn.paper_b.title)}.md)")
-            lines.append("")
-        
-        return "\n".join(lines)
+        header = (
+            f'---\n'
+            f'title: "Hidden Connections - {self._escape_yaml(query) or "Research"}"\n'
+            f'type: connections\n'
+            f'fetched: {datetime.now().strftime("%Y-%m-%d")}\n'
+            f'---\n'
+            f'\n'
+            f'# Hidden Connections\n'
+        )
+        
+        blocks = [
+            f"\n## {conn.paper_a.title} ↔ {conn.paper_b.title}\n"
+            f"\n"
+            f"**Strength:** {'★' * conn.strength}{'☆' * (10 - conn.strength)}\n"
+            f"\n"
+            f"**Reason:** {conn.reason}\n"
+            f"\n"
+            f"- [{conn.paper_a.title}]({self._sanitize_filename(conn.paper_a.title)}.md)\n"
+            f"- [{conn.paper_b.title}]({self._sanitize_filename(conn.paper_b.title)}.md)\n"
+            for conn in connections
+        ]
+        
+        return header + "".join(blocks)
     
     def _sanitize_filename(self, title: str) -> str:
         """Convert title to safe filename."""
         # Remove/replace unsafe characters
-        safe = re.sub(r'[^\w\s-]', '', title)
-        safe = re.sub(r'[-\s]+', '_', safe)
+        safe = _UNSAFE_RE.sub('', title)
+        safe = _COLLAPSE_RE.sub('_', safe)
         # Limit length
         safe = safe[:50].strip('_')
         if not safe:
@@ -156,4 +161,4 @@ class ObsidianExporter(BaseExporter):
     
     def _escape_yaml(self, text: str) -> str:
         """Escape special characters for YAML."""
-        return text.replace('"', '\\"').replace('\\', '\\\\')
+        return text.translate(self._YAML_ESCAPE)
@@ -1,11 +1,15 @@
 """Multi-source adapter architecture for SynapseScanner."""
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
+# Slotted dataclasses (no per-instance __dict__) where supported; slots= needs Python 3.10+
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Paper:
     """Standardized paper representation across all sources."""
     id: str                          # source-specific ID
@@ -20,6 +24,11 @@ class Paper:
     references: List[str] = field(default_factory=list)  # paper IDs this paper cites
     keywords: List[str] = field(default_factory=list)    # extracted keywords
     
+    def __post_init__(self):
+        # A handful of source names are shared by every paper; keep one copy of each
+        if type(self.source) is str:
+            self.source = sys.intern(self.source)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -54,7 +63,7 @@ class Paper:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Connection:
     """Represents a connection between two papers."""
     paper_a: Paper
@@ -130,27 +139,71 @@ class BaseSource(ABC):
         return list(set(keywords))
     
     def _requests_session(self):
-        """Get or create a requests session for connection pooling."""
+        """Get or create a requests session for connection pooling.
+        
+        The session keeps connections alive between searches (requests already
+        asks for gzip) and retries transient failures with backoff.
+        """
         if self._session is None:
             import requests
-            self._session = requests.Session()
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                # Ignore Retry-After: a rate-limited API could otherwise stall
+                # the CLI for minutes; the short backoff bounds the total wait
+                max_retries=Retry(total=3, backoff_factor=0.3,
+                                  status_forcelist=(429, 500, 502, 503, 504),
+                                  respect_retry_after_header=False),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
         return self._session
+    
+    def close(self):
+        """Close the pooled HTTP session, if one was opened."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
 
 
 # Source registry
 SOURCE_REGISTRY: Dict[str, type] = {}
 
 
+# Shared adapter instances, created on first lookup
+_SOURCE_INSTANCES: Dict[str, BaseSource] = {}
+
+
 def register_source(name: str, source_class: type):
     """Register a source class."""
     SOURCE_REGISTRY[name] = source_class
+    # Drop an instance of a previously registered class, releasing its HTTP pool
+    stale = _SOURCE_INSTANCES.pop(name, None)
+    if stale is not None:
+        stale.close()
 
 
 def get_source(name: str) -> Optional[BaseSource]:
-    """Get a source instance by name."""
-    if name in SOURCE_REGISTRY:
-        return SOURCE_REGISTRY[name](name)
-    return None
+    """Get the shared source instance for a name.
+    
+    Instances are created once and reused, so repeated lookups (one per
+    paper when following references) share one pooled HTTP session.
+    """
+    source = _SOURCE_INSTANCES.get(name)
+    if source is None and name in SOURCE_REGISTRY:
+        source = _SOURCE_INSTANCES[name] = SOURCE_REGISTRY[name](name)
+    return source
 
 
 def list_sources() -> List[str]:
@@ -3,6 +3,17 @@ import xml.etree.ElementTree as ET
 from typing import List
 from . import Paper, BaseSource, register_source
 
+_ATOM_NS = {"atom": "http://www.w3.org/2005/Atom"}
+
+try:
+    from lxml import etree as _lxml_etree
+    # C parser with a precompiled entry query; its elements share the ElementTree API.
+    # Feeds arrive from the network, so never expand entities or fetch external DTDs.
+    _LXML_PARSER = _lxml_etree.XMLParser(resolve_entities=False, no_network=True)
+    _ENTRY_XPATH = _lxml_etree.XPath("/atom:feed/atom:entry", namespaces=_ATOM_NS)
+except ImportError:
+    _lxml_etree = None
+
 
 class ArXivSource(BaseSource):
     """ArXiv paper source using the official API."""
@@ -11,7 +22,7 @@ class ArXivSource(BaseSource):
     
     def __init__(self, name: str = "arxiv"):
         super().__init__(name)
-        self.ns = {"atom": "http://www.w3.org/2005/Atom"}
+        self.ns = _ATOM_NS
     
     def search(self, query: str, limit: int = 10) -> List[Paper]:
         """Search ArXiv for papers matching the query."""
@@ -35,9 +46,13 @@ class ArXivSource(BaseSource):
             )
             resp.raise_for_status()
             
-            root = ET.fromstring(resp.text)
+            # Parse the raw bytes; the feed's XML declaration names the encoding
+            if _lxml_etree is not None:
+                entries = _ENTRY_XPATH(_lxml_etree.fromstring(resp.content, _LXML_PARSER))
+            else:
+                entries = ET.fromstring(resp.content).findall("atom:entry", self.ns)
             
-            for entry in root.findall("atom:entry", self.ns):
+            for entry in entries:
                 paper = self._parse_entry(entry)
                 if paper:
                     papers.append(paper)
@@ -4,6 +4,36 @@ import re
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Fallback tags recognised when the AI response has none
+_COMMON_RESEARCH_TERMS = (
+    "machine learning", "deep learning", "neural network", "artificial intelligence",
+    "quantum", "physics", "chemistry", "biology", "medicine", "health",
+    "climate", "environment", "energy", "materials", "nanotechnology",
+    "genetics", "genomics", "protein", "cell", "molecular",
+    "algorithm", "optimization", "simulation", "modeling",
+    "theory", "experiment", "review", "meta-analysis",
+)
+
+
+def _build_tag_automaton():
+    """Compile the fallback terms into an Aho-Corasick automaton, if available."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for rank, term in enumerate(_COMMON_RESEARCH_TERMS):
+        automaton.add_word(term, rank)
+    automaton.make_automaton()
+    return automaton
+
+
+_TAG_AC = _build_tag_automaton()
+
 
 @dataclass
 class Summary:
@@ -239,24 +269,19 @@ Tags: <tag1>, <tag2>, <tag3>, <tag4>, <tag5>"""
     
     def _extract_basic_tags(self, text: str) -> List[str]:
         """Extract basic tags from text when AI doesn't provide them."""
-        # Simple keyword extraction for fallback
-        common_research_terms = [
-            "machine learning", "deep learning", "neural network", "artificial intelligence",
-            "quantum", "physics", "chemistry", "biology", "medicine", "health",
-            "climate", "environment", "energy", "materials", "nanotechnology",
-            "genetics", "genomics", "protein", "cell", "molecular",
-            "algorithm", "optimization", "simulation", "modeling",
-            "theory", "experiment", "review", "meta-analysis"
-        ]
-        
         text_lower = text.lower()
-        tags = []
         
-        for term in common_research_terms:
-            if term in text_lower:
-                tags.append(term.replace(" ", "-"))
-                if len(tags) >= 5:
-                    break
+        if _TAG_AC is not None:
+            # Single pass over the text; keep the term-list priority order
+            ranks = sorted({rank for _, rank in _TAG_AC.iter(text_lower)})[:5]
+            tags = [_COMMON_RESEARCH_TERMS[r].replace(" ", "-") for r in ranks]
+        else:
+            tags = []
+            for term in _COMMON_RESEARCH_TERMS:
+                if term in text_lower:
+                    tags.append(term.replace(" ", "-"))
+                    if len(tags) >= 5:
+                        break
         
         return tags if tags else ["research"]
 
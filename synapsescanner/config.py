@@ -1,8 +1,22 @@
 """Configuration system for SynapseScanner."""
+import copy
+import json
 import os
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
+try:
+    import yaml
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    _YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+except ImportError:
+    yaml = None
+
+# Parsed config files keyed by (path, mtime_ns, size); bounded LRU
+_PARSE_CACHE: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_PARSE_CACHE_SIZE = 100
+
 
 class Config:
     """SynapseScanner configuration management."""
@@ -51,6 +65,9 @@ include_ai_summary: true
 include_connections: true
 """
     
+    # DEFAULT_CONFIG parsed once per process, on first use
+    _default_data: Optional[Dict[str, Any]] = None
+    
     def __init__(self, config_path: Optional[str] = None):
         if config_path is None:
             home = Path.home()
@@ -59,24 +76,91 @@ include_connections: true
             config_path = str(config_dir / "config.yaml")
         
         self.config_path = config_path
-        self._data: Dict[str, Any] = {}
-        self._load_or_create()
+        self._loaded_data: Optional[Dict[str, Any]] = None
+        # (configured obsidian_vault, expanded path), refreshed when the setting changes
+        self._vault_expanded = ("", "")
+        
+        # Create the default file up front; parsing waits until a setting is used
+        path = Path(config_path)
+        self._is_new = not path.exists()
+        if self._is_new:
+            path.write_bytes(self.DEFAULT_CONFIG.encode("utf-8"))
     
-    def _load_or_create(self):
-        """Load existing config or create default."""
-        path = Path(self.config_path)
+    @property
+    def _data(self) -> Dict[str, Any]:
+        """Parsed config, loaded on first access."""
+        if self._loaded_data is None:
+            self._loaded_data = self._load()
+        return self._loaded_data
+    
+    @_data.setter
+    def _data(self, value: Dict[str, Any]):
+        self._loaded_data = value
+    
+    def _load(self) -> Dict[str, Any]:
+        """Load the config file, or the defaults if it was just created."""
+        if self._is_new:
+            if Config._default_data is None:
+                Config._default_data = self._parse_yaml(self.DEFAULT_CONFIG)
+            return copy.deepcopy(Config._default_data)
         
-        if not path.exists():
-            # Create default config
-            path.write_text(self.DEFAULT_CONFIG)
-            self._data = self._parse_yaml(self.DEFAULT_CONFIG)
+        # Load existing config, reusing an earlier parse of the same file state
+        path = Path(self.config_path)
+        st = path.stat()
+        key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+        cached = _PARSE_CACHE.get(key)
+        if cached is None:
+            cached = self._load_parsed(path, st)
+            _PARSE_CACHE[key] = cached
+            if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
         else:
-            # Load existing config
-            content = path.read_text()
-            self._data = self._parse_yaml(content)
+            _PARSE_CACHE.move_to_end(key)
+        # Copy so setters on this instance never touch the cached entry
+        return copy.deepcopy(cached)
+    
+    @property
+    def _sidecar_path(self) -> Path:
+        """JSON copy of the parsed config, reused across runs while the YAML is unchanged."""
+        return Path(self.config_path + ".cache.json")
+    
+    def _load_parsed(self, path: Path, st: os.stat_result) -> Dict[str, Any]:
+        """Load parsed config from the JSON sidecar, or parse the YAML and refresh it."""
+        stamp = [st.st_mtime_ns, st.st_size]
+        sidecar = self._sidecar_path
+        
+        try:
+            cached = json.loads(sidecar.read_bytes())
+            if cached.get("source") == stamp and isinstance(cached.get("data"), dict):
+                return cached["data"]
+        except (OSError, ValueError, AttributeError):
+            pass  # missing, stale or corrupt; fall through to YAML
+        
+        data = self._parse_yaml(path.read_bytes().decode("utf-8"))
+        try:
+            sidecar.write_text(json.dumps({"source": stamp, "data": data}), encoding="utf-8")
+        except (OSError, TypeError, ValueError):
+            pass  # values JSON can't hold, or read-only dir: just skip the sidecar
+        return data
     
     def _parse_yaml(self, content: str) -> Dict[str, Any]:
-        """Simple YAML parser for basic config."""
+        """Parse config YAML, via libyaml when PyYAML is installed.
+        
+        Files PyYAML rejects (e.g. a Windows path with backslashes inside
+        double quotes) or whose top level isn't a mapping go through the
+        basic parser, which accepted them before PyYAML was used.
+        """
+        if yaml is not None:
+            try:
+                data = yaml.load(content, Loader=_YAML_LOADER)
+            except yaml.YAMLError:
+                data = None
+            if isinstance(data, dict):
+                return data
+        return self._parse_basic_yaml(content)
+    
+    def _parse_basic_yaml(self, content: str) -> Dict[str, Any]:
+        """Simple YAML parser for basic config (fallback without PyYAML)."""
         data: Dict[str, Any] = {}
         current_list = None
         current_list_key = None
@@ -145,6 +229,17 @@ include_connections: true
     
     def save(self):
         """Save current config to file."""
+        try:
+            self._sidecar_path.unlink()
+        except OSError:
+            pass
+        
+        if yaml is not None:
+            body = yaml.dump(self._data, Dumper=_YAML_DUMPER, default_flow_style=False,
+                             sort_keys=False, allow_unicode=True)
+            Path(self.config_path).write_bytes(("# SynapseScanner Configuration\n\n" + body).encode("utf-8"))
+            return
+        
         lines = ["# SynapseScanner Configuration", ""]
         
         for key, value in self._data.items():
@@ -162,7 +257,7 @@ include_connections: true
             else:
                 lines.append(f'{key}: "{value}"')
         
-        Path(self.config_path).write_text('\n'.join(lines))
+        Path(self.config_path).write_bytes('\n'.join(lines).encode("utf-8"))
     
     # Property accessors
     @property
@@ -224,7 +319,9 @@ include_connections: true
     @property
     def obsidian_vault(self) -> str:
         path = self._data.get("obsidian_vault", "~/SynapseNotes")
-        return os.path.expanduser(path)
+        if self._vault_expanded[0] != path:
+            self._vault_expanded = (path, os.path.expanduser(path))
+        return self._vault_expanded[1]
     
     @obsidian_vault.setter
     def obsidian_vault(self, value: str):
@@ -1,10 +1,83 @@
 """Cross-reference engine for finding hidden connections between papers."""
-from typing import List, Set, Tuple
+import heapq
+import sys
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple
 from collections import defaultdict
 from .sources import Paper, Connection
 
 
-def find_connections(papers: List[Paper], keyword_threshold: int = 3) -> List[Connection]:
+# Title words too generic to indicate a shared topic
+_COMMON_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'of', 'in', 'on', 'to', 'for',
+    'with', 'by', 'from', 'as', 'is', 'are', 'was', 'were',
+    'study', 'analysis', 'research', 'using', 'based',
+})
+
+
+try:
+    _popcount = int.bit_count  # Python 3.10+
+except AttributeError:
+    def _popcount(bits: int) -> int:
+        return bin(bits).count("1")
+
+
+# Bitmasks are as wide as the batch vocabulary. Past this many distinct tokens
+# (large, sparse corpora) ANDing them costs more than intersecting the small
+# per-paper sets, so overlaps are counted from the sets instead.
+_MAX_BITMASK_VOCAB = 8192
+
+
+class _PaperBits(NamedTuple):
+    """Comparison sets packed into int bitmasks over the batch vocabulary."""
+    authors: int
+    keywords: int
+    title_words: int
+
+
+class _PaperFeatures(NamedTuple):
+    """Lowercased attribute sets compared between papers.
+    
+    For batches with a small vocabulary the sets are also packed into
+    ``bits``, so overlap sizes are a C-level AND plus popcount.
+    """
+    authors: FrozenSet[str]
+    keywords: FrozenSet[str]
+    title_words: FrozenSet[str]
+    bits: Optional[_PaperBits] = None
+
+
+def _to_bits(tokens: FrozenSet[str], vocab: Dict[str, int]) -> int:
+    """Pack tokens into a bitmask using each token's bit position in vocab."""
+    bits = 0
+    for token in tokens:
+        bits |= 1 << vocab[token]
+    return bits
+
+
+def _with_bits(features: _PaperFeatures, vocab: Dict[str, int]) -> _PaperFeatures:
+    """Add the bitmask form of each comparison set."""
+    return features._replace(bits=_PaperBits(
+        authors=_to_bits(features.authors, vocab),
+        keywords=_to_bits(features.keywords, vocab),
+        title_words=_to_bits(features.title_words, vocab),
+    ))
+
+
+def _paper_features(paper: Paper) -> _PaperFeatures:
+    """Build the comparison sets for a paper (once per paper, not per pair)."""
+    # Interned, so a token shared across papers is one object and compares by identity
+    authors = frozenset(sys.intern(a.lower()) for a in paper.authors)
+    keywords = frozenset(sys.intern(k.lower()) for k in paper.keywords)
+    title_words = frozenset(map(sys.intern, paper.title.lower().split())) - _COMMON_WORDS
+    return _PaperFeatures(
+        authors=authors,
+        keywords=keywords,
+        title_words=title_words,
+    )
+
+
+def find_connections(papers: List[Paper], keyword_threshold: int = 3,
+                     top_k: Optional[int] = None) -> List[Connection]:
     """Find connections between papers from different sources.
     
     Detects connections based on:
@@ -14,35 +87,60 @@ def find_connections(papers: List[Paper], keyword_threshold: int = 3) -> List[Co
     Args:
         papers: List of papers to analyze
         keyword_threshold: Minimum number of shared keywords for a connection
+        top_k: If set, return only the strongest top_k connections
         
     Returns:
-        List of Connection objects
+        List of Connection objects, strongest first
     """
     connections = []
     
-    # Group papers by source for comparison
-    papers_by_source = defaultdict(list)
+    # Rank sources by first appearance; pairs are compared in source order
+    source_rank: Dict[str, int] = {}
     for paper in papers:
-        papers_by_source[paper.source].append(paper)
-    
-    sources = list(papers_by_source.keys())
+        source_rank.setdefault(paper.source, len(source_rank))
+    
+    # Lowercase and split each paper once, instead of once per compared pair
+    features = [_paper_features(p) for p in papers]
+    tokens = [f.authors | f.keywords | f.title_words for f in features]
+    
+    # Inverted index: a pair can only score if the papers share some token,
+    # so only pairs found through the index are compared
+    index: Dict[str, List[int]] = defaultdict(list)
+    for pos, paper_tokens in enumerate(tokens):
+        for token in paper_tokens:
+            index[token].append(pos)
+    
+    # The index keys are the batch vocabulary; pack masks only while it's small
+    if len(index) <= _MAX_BITMASK_VOCAB:
+        vocab = {token: bit for bit, token in enumerate(index)}
+        features = [_with_bits(f, vocab) for f in features]
+    
+    pairs: Set[Tuple[int, int]] = set()
+    for pos_a, paper_tokens in enumerate(tokens):
+        rank_a = source_rank[papers[pos_a].source]
+        for token in paper_tokens:
+            for pos_b in index[token]:
+                if source_rank[papers[pos_b].source] > rank_a:
+                    pairs.add((pos_a, pos_b))
     
     # Compare papers from different sources
-    for i, source_a in enumerate(sources):
-        for source_b in sources[i+1:]:
-            for paper_a in papers_by_source[source_a]:
-                for paper_b in papers_by_source[source_b]:
-                    strength, reason = _calculate_connection(
-                        paper_a, paper_b, keyword_threshold
-                    )
-                    
-                    if strength > 0:
-                        connections.append(Connection(
-                            paper_a=paper_a,
-                            paper_b=paper_b,
-                            strength=strength,
-                            reason=reason
-                        ))
+    for pos_a, pos_b in sorted(pairs, key=lambda pair: (
+            source_rank[papers[pair[0]].source], source_rank[papers[pair[1]].source], pair)):
+        strength, reason = _calculate_connection(
+            features[pos_a], features[pos_b], keyword_threshold
+        )
+        
+        if strength > 0:
+            connections.append(Connection(
+                paper_a=papers[pos_a],
+                paper_b=papers[pos_b],
+                strength=strength,
+                reason=reason
+            ))
+    
+    # Partial selection when only the strongest few are wanted; same order as a full sort
+    if top_k is not None and len(connections) > top_k:
+        return heapq.nlargest(top_k, connections, key=lambda c: c.strength)
     
     # Sort by strength (descending)
     connections.sort(key=lambda c: c.strength, reverse=True)
@@ -50,54 +148,51 @@ def find_connections(papers: List[Paper], keyword_threshold: int = 3) -> List[Co
     return connections
 
 
-def _calculate_connection(paper_a: Paper, paper_b: Paper, 
+def _calculate_connection(features_a: _PaperFeatures, features_b: _PaperFeatures,
                           keyword_threshold: int) -> Tuple[int, str]:
     """Calculate connection strength between two papers.
     
     Returns:
         Tuple of (strength 1-10, reason string)
     """
+    bits_a, bits_b = features_a.bits, features_b.bits
+    if bits_a is not None and bits_b is not None:
+        n_authors = _popcount(bits_a.authors & bits_b.authors)
+        n_keywords = _popcount(bits_a.keywords & bits_b.keywords)
+        n_title_words = _popcount(bits_a.title_words & bits_b.title_words)
+    else:
+        n_authors = len(features_a.authors & features_b.authors)
+        n_keywords = len(features_a.keywords & features_b.keywords)
+        n_title_words = len(features_a.title_words & features_b.title_words)
+    
+    # Most pairs score nothing; settle those without building any sets
+    if not n_authors and n_keywords < keyword_threshold and n_title_words < 2:
+        return 0, ""
+    
     strength = 0
     reasons = []
     
     # Check for shared authors
-    authors_a = {a.lower() for a in paper_a.authors}
-    authors_b = {b.lower() for b in paper_b.authors}
-    shared_authors = authors_a & authors_b
-    
-    if shared_authors:
+    if n_authors:
         # Strength based on number of shared authors
-        author_strength = min(len(shared_authors) * 3, 7)
+        author_strength = min(n_authors * 3, 7)
         strength += author_strength
-        author_names = list(shared_authors)[:3]
+        author_names = list(features_a.authors & features_b.authors)[:3]
         reasons.append(f"Shared authors: {', '.join(author_names)}")
     
     # Check for shared keywords
-    keywords_a = {k.lower() for k in paper_a.keywords}
-    keywords_b = {k.lower() for k in paper_b.keywords}
-    shared_keywords = keywords_a & keywords_b
-    
-    if len(shared_keywords) >= keyword_threshold:
+    if n_keywords >= keyword_threshold:
         # Strength based on number of shared keywords
-        keyword_strength = min(len(shared_keywords), 5)
+        keyword_strength = min(n_keywords, 5)
         strength += keyword_strength
-        keyword_list = list(shared_keywords)[:5]
+        keyword_list = list(features_a.keywords & features_b.keywords)[:5]
         reasons.append(f"Shared keywords: {', '.join(keyword_list)}")
     
-    # Check for title similarity (simple word overlap)
-    title_words_a = set(paper_a.title.lower().split())
-    title_words_b = set(paper_b.title.lower().split())
-    # Remove common words
-    common_words = {'the', 'a', 'an', 'and', 'or', 'of', 'in', 'on', 'to', 'for',
-                    'with', 'by', 'from', 'as', 'is', 'are', 'was', 'were',
-                    'study', 'analysis', 'research', 'using', 'based'}
-    title_words_a -= common_words
-    title_words_b -= common_words
-    
-    shared_title_words = title_words_a & title_words_b
-    if len(shared_title_words) >= 2:
-        title_strength = min(len(shared_title_words), 3)
+    # Check for title similarity (simple word overlap, common words removed)
+    if n_title_words >= 2:
+        title_strength = min(n_title_words, 3)
         strength += title_strength
+        shared_title_words = features_a.title_words & features_b.title_words
         reasons.append(f"Similar topics: {', '.join(list(shared_title_words)[:3])}")
     
     # Cap strength at 10
@@ -123,20 +218,17 @@ def find_citation_trails(papers: List[Paper]) -> List[Tuple[Paper, Paper]]:
     """
     trails = []
     
-    # Build lookup by ID
+    # Build lookup by ID; when several sources share an ID, the first paper wins
     paper_by_id = {}
     for paper in papers:
         if paper.id:
-            paper_by_id[(paper.id, paper.source)] = paper
+            paper_by_id.setdefault(paper.id, paper)
     
-    # Check each paper's references
+    # Check each paper's references against our set
     for paper in papers:
         for ref_id in paper.references:
-            # Look for referenced paper in our set
-            for source in set(p.source for p in papers):
-                key = (ref_id, source)
-                if key in paper_by_id:
-                    trails.append((paper, paper_by_id[key]))
-                    break
+            cited = paper_by_id.get(ref_id)
+            if cited is not None:
+                trails.append((paper, cited))
     
     return trails
@@ -1,7 +1,7 @@
 """JSON exporter for SynapseScanner."""
 import json
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from . import BaseExporter
 from ..sources import Paper, Connection
 
@@ -21,19 +21,28 @@ class JSONExporter(BaseExporter):
         Returns:
             JSON string
         """
+        # Serialize each paper once; connections refer to the same papers many times
+        paper_dicts: Dict[int, Dict[str, Any]] = {}
+        
+        def as_dict(paper: Paper) -> Dict[str, Any]:
+            cached = paper_dicts.get(id(paper))
+            if cached is None:
+                cached = paper_dicts[id(paper)] = paper.to_dict()
+            return cached
+        
         data = {
             "version": "1.3.0",
             "generated_at": datetime.now().isoformat(),
             "count": len(papers),
-            "papers": [paper.to_dict() for paper in papers]
+            "papers": [as_dict(paper) for paper in papers]
         }
         
         if connections:
             if include_raw:
                 data["connections"] = [
                     {
-                        "paper_a": conn.paper_a.to_dict(),
-                        "paper_b": conn.paper_b.to_dict(),
+                        "paper_a": as_dict(conn.paper_a),
+                        "paper_b": as_dict(conn.paper_b),
                         "strength": conn.strength,
                         "reason": conn.reason
                     }
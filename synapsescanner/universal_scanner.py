@@ -8,9 +8,13 @@ Obsidian export, and watch mode.
 import os
 import sys
 import argparse
+import importlib
 import time
+import re
 import json
-from typing import List, Optional
+import collections
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
 # Ensure our src directory is in path
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -41,41 +45,35 @@ except ImportError as e:
     print(f"Import error: {e}")
     CACHE_AVAILABLE = False
 
-try:
-    from synapsescanner.crossref import find_connections
-    CROSSREF_AVAILABLE = True
-except ImportError:
-    CROSSREF_AVAILABLE = False
-
-try:
-    from synapsescanner.ai import AISummarizer, summarize_abstract
-    AI_AVAILABLE = True
-except ImportError:
-    AI_AVAILABLE = False
 
-try:
-    from synapsescanner.exporters.obsidian import ObsidianExporter
-    from synapsescanner.exporters.json import JSONExporter
-    EXPORTERS_AVAILABLE = True
-except ImportError:
-    EXPORTERS_AVAILABLE = False
-
-try:
-    from synapsescanner.citations import CitationTracker, format_citation_report
-    CITATIONS_AVAILABLE = True
-except ImportError:
-    CITATIONS_AVAILABLE = False
+def _optional_import(module_name: str):
+    """Import an optional feature module on first use.
+    
+    Keeps cold start cheap for invocations that never touch the feature:
+    ``--cheat`` and ``--matrix`` load none of them, and ``--json``/``--md``
+    skip the AI summarizer. Returns None if unavailable.
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
 
-try:
-    from synapsescanner.autodocs import BreakthroughDocumenter
-    from synapsescanner.git_autocommit import GitAutoCommit
-    AUTODOCS_AVAILABLE = True
-except ImportError:
-    AUTODOCS_AVAILABLE = False
 
 REPO_URL = "https://github.com/CrazhHolmes/SynapseScanner"
 VERSION = "1.4.0"
 
+# Keywords tallied by build_keyword_counter
+_KEYWORDS = (
+    "quantum", "entanglement", "superposition", "metamaterial",
+    "neural", "AI", "machine learning", "photon", "laser",
+    "gravitational", "time crystal", "topology", "spin",
+    "lattice", "superconductor", "plasma", "dark matter",
+)
+# One longest-first alternation finds every keyword occurrence in a single pass.
+# Patterns keep their case while the text is lowercased, so "AI" still never
+# matches rather than hitting every "ai" substring (e.g. "domain").
+_KW_RE = re.compile("|".join(re.escape(kw) for kw in sorted(_KEYWORDS, key=len, reverse=True)))
+
 
 def fetch_from_sources(query: str, sources: List[str], limit: int, 
                        use_cache: bool = True) -> List[Paper]:
@@ -115,7 +113,7 @@ def fetch_from_sources(query: str, sources: List[str], limit: int,
             if use_cache and CACHE_AVAILABLE:
                 cache = get_cache()
                 cache.save_papers(papers)
-                cache.record_query(query, source_name, limit, len(papers))
+                cache.record_query(query, source_name, limit, len(papers), papers)
             
             all_papers.extend(papers)
             show_status(f"Found {len(papers)} papers from {source_name}", "ok", done=True)
@@ -123,7 +121,14 @@ def fetch_from_sources(query: str, sources: List[str], limit: int,
         except Exception as e:
             show_status(f"{source_name} error: {str(e)[:40]}", "err", done=True)
     
-    return all_papers
+    # Drop duplicates returned by several sources or cache + live fetches
+    seen: Dict[Tuple[str, str], Paper] = {}
+    for paper in all_papers:
+        key = (paper.id, paper.source)
+        if key not in seen:
+            seen[key] = paper
+    
+    return list(seen.values())
 
 
 def fetch_references_recursive(papers: List[Paper], depth: int, 
@@ -141,8 +146,9 @@ def fetch_references_recursive(papers: List[Paper], depth: int,
     if depth <= 0:
         return papers
     
-    all_papers = list(papers)
-    seen_ids = {(p.id, p.source) for p in papers}
+    seen: Dict[Tuple[str, str], Paper] = {}
+    for p in papers:
+        seen.setdefault((p.id, p.source), p)
     
     for level in range(depth):
         show_status(f"Digging deeper... level {level + 1}/{depth}", "info")
@@ -157,8 +163,8 @@ def fetch_references_recursive(papers: List[Paper], depth: int,
                 refs = source.fetch_references(paper)
                 for ref in refs[:max_per_paper]:
                     key = (ref.id, ref.source)
-                    if key not in seen_ids:
-                        seen_ids.add(key)
+                    if key not in seen:
+                        seen[key] = ref
                         new_papers.append(ref)
             except Exception:
                 pass
@@ -166,12 +172,11 @@ def fetch_references_recursive(papers: List[Paper], depth: int,
         if not new_papers:
             break
         
-        all_papers.extend(new_papers)
         papers = new_papers
         
         show_status(f"Level {level + 1}: Found {len(new_papers)} more papers", "ok", done=True)
     
-    return all_papers
+    return list(seen.values())
 
 
 def detect_patterns(papers: List[Paper]):
@@ -179,27 +184,28 @@ def detect_patterns(papers: List[Paper]):
     patterns = []
     
     for paper in papers:
-        txt = (paper.title + " " + paper.abstract).lower()
+        title_l = paper.title.lower()
+        abs_l = paper.abstract.lower()
         
-        if any(q in txt for q in ["quantum", "entanglement", "superposition"]):
+        if any(q in title_l or q in abs_l for q in ["quantum", "entanglement", "superposition"]):
             patterns.append({
                 "pattern": "Quantum breakthrough",
                 "hint": "Test quantum erasure with polarized lenses & laser pointer",
                 "cost": "~$30", "difficulty": "Easy",
             })
-        if any(m in txt for m in ["metamaterial", "negative index"]):
+        if any(m in title_l or m in abs_l for m in ["metamaterial", "negative index"]):
             patterns.append({
                 "pattern": "Metamaterial lens",
                 "hint": "Stack microscope slides + oil for negative index demo",
                 "cost": "~$20", "difficulty": "Easy",
             })
-        if any(t in txt for t in ["time crystal", "temporal", "periodic"]):
+        if any(t in title_l or t in abs_l for t in ["time crystal", "temporal", "periodic"]):
             patterns.append({
                 "pattern": "Temporal periodicity",
                 "hint": "555 timer + LED at 1 Hz, observe after-image",
                 "cost": "~$5", "difficulty": "Easy",
             })
-        if any(a in txt for a in ["neural", "AI", "machine learning"]):
+        if any(a in title_l or a in abs_l for a in ["neural", "AI", "machine learning"]):
             patterns.append({
                 "pattern": "AI physics",
                 "hint": "Train tiny model on physics data, predict pendulum motion",
@@ -211,30 +217,17 @@ def detect_patterns(papers: List[Paper]):
 
 def build_keyword_counter(papers: List[Paper]):
     """Count notable keywords across papers."""
-    import collections
     counter = collections.Counter()
-    keywords = [
-        "quantum", "entanglement", "superposition", "metamaterial",
-        "neural", "AI", "machine learning", "photon", "laser",
-        "gravitational", "time crystal", "topology", "spin",
-        "lattice", "superconductor", "plasma", "dark matter",
-    ]
     
     for paper in papers:
-        txt = (paper.title + " " + paper.abstract).lower()
-        for kw in keywords:
-            n = txt.count(kw)
-            if n:
-                counter[kw] += n
+        counter.update(_KW_RE.findall(paper.title.lower()))
+        counter.update(_KW_RE.findall(paper.abstract.lower()))
     
     return counter
 
 
 def watch_mode(args, config):
     """Run in watch mode (daemon-like loop)."""
-    import time
-    from datetime import datetime
-    
     sleep_hours = 6
     show_status(f"Watch mode active. Checking every {sleep_hours} hours.", "info", done=True)
     show_status("Press Ctrl+C to stop", "info", done=True)
@@ -399,14 +392,19 @@ def main():
         
         # Find connections
         connections = []
-        if CROSSREF_AVAILABLE and len(papers) > 1:
-            connections = find_connections(papers)
+        if len(papers) > 1:
+            crossref = _optional_import("synapsescanner.crossref")
+            if crossref:
+                connections = crossref.find_connections(papers)
         
         # AI Summarization
         ai_summaries = []
-        if args.summarize and AI_AVAILABLE and not args.json and not args.md:
+        # Summaries are only shown in the interactive UI, so machine-readable modes skip the import
+        wants_summaries = args.summarize and not args.json and not args.md
+        ai = _optional_import("synapsescanner.ai") if wants_summaries else None
+        if ai:
             show_status("Generating AI summaries...", "info")
-            summarizer = AISummarizer()
+            summarizer = ai.AISummarizer()
             
             for i, paper in enumerate(papers[:3]):  # Summarize top 3
                 summary = summarizer.summarize(paper.abstract, paper.title)
@@ -417,30 +415,38 @@ def main():
                 show_status(f"Generated {len(ai_summaries)} summaries", "ok", done=True)
         
         # JSON output mode
-        if args.json and EXPORTERS_AVAILABLE:
-            exporter = JSONExporter()
-            output = exporter.export(papers, connections)
-            print(output)
-            return
+        if args.json:
+            json_exporter = _optional_import("synapsescanner.exporters.json")
+            if json_exporter:
+                exporter = json_exporter.JSONExporter()
+                output = exporter.export(papers, connections)
+                print(output)
+                return
+        
+        obsidian = None
+        if args.md or args.export_obsidian:
+            obsidian = _optional_import("synapsescanner.exporters.obsidian")
         
         # Markdown output mode
-        if args.md and EXPORTERS_AVAILABLE:
-            exporter = ObsidianExporter()
+        if args.md and obsidian:
+            exporter = obsidian.ObsidianExporter()
             output = exporter.export_to_string(papers, connections, args.query or "")
             print(output)
             return
         
         # Obsidian export
-        if args.export_obsidian and EXPORTERS_AVAILABLE:
-            exporter = ObsidianExporter(args.export_obsidian)
+        if args.export_obsidian and obsidian:
+            exporter = obsidian.ObsidianExporter(args.export_obsidian)
             result = exporter.export(papers, connections, args.query or "")
             show_status(result, "ok", done=True)
         
         # Standard UI output
-        # Progress display
+        # Progress display; only short lists are animated, capped at 0.5s total
+        delay = min(0.02, 0.5 / len(papers)) if 0 < len(papers) < 20 else 0
         for i, paper in enumerate(papers, 1):
             show_progress(paper.url, i, len(papers))
-            time.sleep(0.02)
+            if delay:
+                time.sleep(delay)
         sys.stdout.write("\n")
         
         # Detect patterns
@@ -448,10 +454,12 @@ def main():
         show_results(patterns)
         
         # AutoDocs: Generate breakthrough documentation (v1.4.0)
-        if patterns and AUTODOCS_AVAILABLE:
+        autodocs = _optional_import("synapsescanner.autodocs") if patterns else None
+        git_autocommit = _optional_import("synapsescanner.git_autocommit") if autodocs else None
+        if autodocs and git_autocommit:
             # Always prepare docs internally on breakthrough detection (hard-coded)
-            documenter = BreakthroughDocumenter()
-            git = GitAutoCommit()
+            documenter = autodocs.BreakthroughDocumenter()
+            git = git_autocommit.GitAutoCommit()
             
             # Check if auto-docs explicitly enabled or configured
             auto_docs_enabled = args.auto_docs
@@ -476,27 +484,20 @@ def main():
                                 }
                                 break
                     
-                    # Generate breakthrough doc
-                    doc_content = documenter.generate_breakthrough_doc(
+                    # Write the doc, log entry and README entry as one batch
+                    doc_path = documenter.emit_breakthrough(
                         pattern=pattern,
                         papers=papers,
                         connections=connections,
                         ai_summary=ai_summary,
-                        query=args.query or ""
+                        query=args.query or "",
+                        update_readme=args.update_readme,
+                        breakthrough_log=args.breakthrough_log
                     )
-                    
-                    # Save full documentation
-                    doc_path = documenter.save_breakthrough_doc(pattern, doc_content)
                     if doc_path:
                         docs_generated.append(str(doc_path))
-                    
-                    # Update breakthrough log
-                    if args.breakthrough_log:
-                        documenter.maintain_breakthrough_log(pattern, doc_content)
-                    
-                    # Update README
-                    if args.update_readme:
-                        documenter.update_readme(pattern, doc_content)
+                
+                documenter.close()
                 
                 # Show preview
                 if docs_generated:
@@ -538,14 +539,15 @@ def main():
                 })
         
         # Show citation tracking (v1.4.0)
-        if args.citations and CITATIONS_AVAILABLE and not args.json and not args.md:
+        citations_mod = _optional_import("synapsescanner.citations") if args.citations else None
+        if citations_mod and not args.json and not args.md:
             show_status("Fetching citation data...", "info")
-            tracker = CitationTracker()
+            tracker = citations_mod.CitationTracker()
             
             for paper in papers[:3]:  # Check top 3 papers
                 citations = tracker.get_citations(paper.id, paper.source)
                 if citations:
-                    report = format_citation_report(citations, paper.title)
+                    report = citations_mod.format_citation_report(citations, paper.title)
                     print(report)
             
             show_status("Citation analysis complete", "ok", done=True)
@@ -0,0 +1,130 @@
+"""Test breakthrough documentation generator."""
+import pytest
+from synapsescanner.sources import Paper, Connection
+from synapsescanner.autodocs import BreakthroughDocumenter
+
+
+class TestBreakthroughDocumenter:
+    """Test BreakthroughDocumenter helpers."""
+    
+    def test_slugify(self, tmp_path):
+        documenter = BreakthroughDocumenter(str(tmp_path))
+        assert documenter._slugify(" Quantum  break-through! (v2) ") == "quantum-break-through-v2"
+        assert len(documenter._slugify("x" * 80)) == 50
+    
+    def test_sources_list_is_sorted(self, tmp_path):
+        documenter = BreakthroughDocumenter(str(tmp_path))
+        papers = [Paper(id=str(i), title="T", source=s) for i, s in enumerate(["pubmed", "arxiv", "pubmed"])]
+        assert documenter._get_sources_list(papers) == "arxiv, pubmed"
+        assert documenter._get_sources_list([]) == "N/A"
+    
+    @pytest.mark.parametrize("pattern_name,expected", [
+        ("Quantum breakthrough", ["quantum", "physics", "optics"]),
+        ("Temporal periodicity", ["time-crystals", "condensed-matter", "physics"]),
+        ("AI physics", ["machine-learning", "physics", "AI"]),
+        ("Brain scans", []),
+    ])
+    def test_generate_tags(self, tmp_path, pattern_name, expected):
+        documenter = BreakthroughDocumenter(str(tmp_path))
+        assert documenter._generate_tags(pattern_name, []) == expected + ["breakthrough", "experiment"]
+    
+    @pytest.mark.parametrize("strengths,label", [
+        ([], "⭐⭐⭐☆☆ (Medium)"),
+        ([1, 2], "⭐⭐☆☆☆ (Low)"),
+        ([3], "⭐⭐⭐☆☆ (Medium)"),
+        ([4, 6], "⭐⭐⭐⭐☆ (High)"),
+        ([7], "⭐⭐⭐⭐⭐ (Very High)"),
+        ([10, 9], "⭐⭐⭐⭐⭐ (Very High)"),
+    ])
+    def test_calculate_confidence(self, tmp_path, strengths, label):
+        documenter = BreakthroughDocumenter(str(tmp_path))
+        connections = [Connection(Paper(id="a", title="A"), Paper(id="b", title="B"), s, "") for s in strengths]
+        assert documenter._calculate_confidence(connections) == label
+    
+    def test_update_readme_creates_section(self, tmp_path):
+        readme = tmp_path / "README.md"
+        readme.write_text("# Project\n\nIntro\n\n## Usage\n\nRun it.\n", encoding="utf-8")
+        documenter = BreakthroughDocumenter(str(tmp_path))
+        
+        pattern = {"pattern": "Quantum breakthrough", "cost": "~$30", "difficulty": "Easy"}
+        assert documenter.update_readme(pattern, "")
+        
+        content = readme.read_text(encoding="utf-8")
+        assert content.index("## Latest Discoveries") < content.index("## Usage")
+        assert "### 🧪 Quantum breakthrough" in content
+    
+    def test_update_readme_preserves_crlf(self, tmp_path):
+        readme = tmp_path / "README.md"
+        readme.write_bytes(b"# Project\r\n\r\n## Usage\r\n\r\nRun it.\r\n")
+        documenter = BreakthroughDocumenter(str(tmp_path))
+        
+        for name in ("Quantum breakthrough", "AI physics"):
+            assert documenter.update_readme({"pattern": name}, "")
+        
+        raw = readme.read_bytes()
+        assert b"\n" not in raw.replace(b"\r\n", b"")
+        assert raw.endswith(b"## Usage\r\n\r\nRun it.\r\n")
+        assert raw.count("### 🧪".encode("utf-8")) == 2
+        assert sorted(p.name for p in tmp_path.iterdir() if p.is_file()) == ["README.md"]
+    
+    def test_update_readme_keeps_mode(self, tmp_path):
+        readme = tmp_path / "README.md"
+        readme.write_text("# Project\n", encoding="utf-8")
+        readme.chmod(0o640)
+        documenter = BreakthroughDocumenter(str(tmp_path))
+        
+        assert documenter.update_readme({"pattern": "Quantum breakthrough"}, "")
+        assert readme.stat().st_mode & 0o777 == 0o640
+    
+    def test_update_readme_failure_removes_temp_file(self, tmp_path, monkeypatch):
+        readme = tmp_path / "README.md"
+        readme.write_text("# Project\n", encoding="utf-8")
+        documenter = BreakthroughDocumenter(str(tmp_path))
+        
+        def fail(src, dst):
+            raise OSError("disk full")
+        monkeypatch.setattr("synapsescanner.autodocs.os.replace", fail)
+        
+        assert not documenter.update_readme({"pattern": "Quantum breakthrough"}, "")
+        assert readme.read_text(encoding="utf-8") == "# Project\n"
+        assert sorted(p.name for p in tmp_path.iterdir() if p.is_file()) == ["README.md"]
+    
+    def test_update_readme_keeps_last_five_entries(self, tmp_path):
+        readme = tmp_path / "README.md"
+        readme.write_text("# Project\n", encoding="utf-8")
+        documenter = BreakthroughDocumenter(str(tmp_path))
+        
+        for name in "ABCDEFG":
+            assert documenter.update_readme({"pattern": name}, "")
+        
+        content = readme.read_text(encoding="utf-8")
+        assert content.count("### 🧪") == 5
+        assert "### 🧪 G" in content and "### 🧪 A" not in content
+        # One separator between each pair of entries, never doubled up
+        assert content.count("\n---\n") == 4
+    
+    def test_breakthrough_log_appends_after_header(self, tmp_path):
+        documenter = BreakthroughDocumenter(str(tmp_path))
+        for name in ("Quantum breakthrough", "AI physics"):
+            assert documenter.maintain_breakthrough_log({"pattern": name}, "")
+        
+        # Entries are visible on disk before the handle is closed
+        content = documenter.breakthrough_log_path.read_text(encoding="utf-8")
+        documenter.close()
+        assert content.count("# SynapseScanner Breakthrough Log") == 1
+        assert content.index("Quantum breakthrough") < content.index("AI physics")
+    
+    def test_emit_breakthrough_writes_all_outputs(self, tmp_path):
+        (tmp_path / "README.md").write_text("# Project\n", encoding="utf-8")
+        documenter = BreakthroughDocumenter(str(tmp_path))
+        
+        pattern = {"pattern": "Quantum breakthrough", "hint": "h", "cost": "~$30", "difficulty": "Easy"}
+        papers = [Paper(id="1", title="Entangled photons", source="arxiv")]
+        doc_path = documenter.emit_breakthrough(pattern, papers, [], query="quantum",
+                                                update_readme=True, breakthrough_log=True)
+        documenter.close()
+        
+        assert doc_path.exists()
+        assert "**Query:** quantum" in doc_path.read_text(encoding="utf-8")
+        assert "Quantum breakthrough" in documenter.breakthrough_log_path.read_text(encoding="utf-8")
+        assert "### 🧪 Quantum breakthrough" in (tmp_path / "README.md").read_text(encoding="utf-8")
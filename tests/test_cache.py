@@ -0,0 +1,100 @@
+"""Test SQLite paper cache."""
+import pytest
+from synapsescanner.sources import Paper
+from synapsescanner.cache import Cache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = Cache(str(tmp_path / "cache.db"))
+    yield cache
+    cache.close()
+
+
+class TestCache:
+    """Test Cache round-trips."""
+    
+    def test_save_and_load_papers(self, cache):
+        papers = [
+            Paper(id="1", title="One", authors=["A"], source="arxiv", keywords=["x"]),
+            Paper(id="2", title="Two", references=["1"], source="arxiv", citations=3),
+        ]
+        cache.save_papers(papers)
+        
+        loaded = cache.get_paper_by_id("2", "arxiv")
+        assert loaded == papers[1]
+        assert {p.id for p in cache.get_all_papers()} == {"1", "2"}
+    
+    def test_iter_papers_stops_early(self, cache):
+        cache.save_papers([Paper(id=str(i), title=f"Paper {i}", source="arxiv") for i in range(300)])
+        
+        papers = cache.iter_papers()
+        first = next(papers)
+        assert first.source == "arxiv"
+        # The cache stays usable while the iterator is open
+        assert cache.get_stats()["total_papers"] == 300
+        assert len(list(papers)) == 299
+        assert len(cache.get_all_papers(limit=10)) == 10
+    
+    def test_iter_papers_closed_early_releases_read(self, cache):
+        cache.save_papers([Paper(id=str(i), title=f"Paper {i}", source="arxiv") for i in range(300)])
+        
+        papers = cache.iter_papers()
+        next(papers)
+        papers.close()
+        
+        # No statement is left open, so writes and a WAL checkpoint go through
+        cache.clear_cache()
+        with cache._lock:
+            busy = cache._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()[0]
+        assert busy == 0
+        assert cache.get_stats()["total_papers"] == 0
+    
+    def test_save_papers_replaces_existing(self, cache):
+        cache.save_papers([Paper(id="1", title="Old", source="arxiv")])
+        cache.save_papers([Paper(id="1", title="New", source="arxiv")])
+        
+        assert cache.get_paper_by_id("1", "arxiv").title == "New"
+        assert cache.get_stats()["total_papers"] == 1
+    
+    def test_get_cached_requires_recorded_query(self, cache):
+        papers = [Paper(id="1", title="One", source="arxiv")]
+        cache.save_papers(papers)
+        assert cache.get_cached("quantum", "arxiv") is None
+        
+        cache.record_query("quantum", "arxiv", 10, len(papers), papers)
+        assert cache.get_cached("quantum", "arxiv") == papers
+    
+    def test_get_cached_only_returns_papers_for_that_query(self, cache):
+        quantum = [Paper(id="1", title="Q1", source="arxiv"), Paper(id="2", title="Q2", source="arxiv")]
+        lasers = [Paper(id="3", title="L1", source="arxiv")]
+        for query, papers in (("quantum", quantum), ("lasers", lasers)):
+            cache.save_papers(papers)
+            cache.record_query(query, "arxiv", 10, len(papers), papers)
+        
+        assert cache.get_cached("quantum", "arxiv") == quantum
+        assert cache.get_cached("lasers", "arxiv") == lasers
+        assert cache.get_cached("quantum", "pubmed") is None
+    
+    def test_reopen_sees_saved_papers(self, tmp_path):
+        db_path = str(tmp_path / "cache.db")
+        first = Cache(db_path)
+        first.save_papers([Paper(id="1", title="One", source="arxiv")])
+        first.close()
+        
+        second = Cache(db_path)
+        assert second.get_paper_by_id("1", "arxiv").title == "One"
+        second.close()
+    
+    def test_get_stats(self, cache):
+        cache.save_papers([
+            Paper(id="1", title="One", source="arxiv"),
+            Paper(id="2", title="Two", source="pubmed"),
+            Paper(id="3", title="Three", source="pubmed"),
+        ])
+        cache.record_query("q", "pubmed", 10, 2)
+        
+        stats = cache.get_stats()
+        assert stats["total_papers"] == 3
+        assert stats["total_queries"] == 1
+        assert stats["by_source"] == {"arxiv": 1, "pubmed": 2}
@@ -0,0 +1,133 @@
+"""Test configuration loading and saving."""
+import pytest
+from synapsescanner import config as config_module
+from synapsescanner.config import Config
+
+
+class TestConfig:
+    """Test Config."""
+    
+    def test_creates_default_config(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        config = Config(str(path))
+        
+        assert path.exists()
+        assert config.default_sources == ["arxiv", "semantic_scholar"]
+        assert config.max_results == 15
+        assert config.ai_provider is None
+        assert config.ollama_model == "llama3.2"
+        assert config.breakthrough_log is True
+        assert config.auto_docs is False
+    
+    def test_default_parse_is_shared_but_not_aliased(self, tmp_path):
+        first = Config(str(tmp_path / "a.yaml"))
+        first.default_sources.append("pubmed")
+        second = Config(str(tmp_path / "b.yaml"))
+        assert second.default_sources == ["arxiv", "semantic_scholar"]
+    
+    def test_basic_parser_matches_default(self, tmp_path):
+        config = Config(str(tmp_path / "config.yaml"))
+        assert config._parse_basic_yaml(Config.DEFAULT_CONFIG) == config._data
+    
+    def test_save_round_trip(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        config = Config(str(path))
+        config.max_results = 40
+        config.default_sources = ["pubmed"]
+        config.webhook_url = "https://example.com/hook"
+        config.save()
+        
+        reloaded = Config(str(path))
+        assert reloaded.max_results == 40
+        assert reloaded.default_sources == ["pubmed"]
+        assert reloaded.webhook_url == "https://example.com/hook"
+        assert reloaded.ai_provider is None
+    
+    @pytest.mark.parametrize("use_yaml", [True, False])
+    def test_save_round_trip_non_ascii(self, tmp_path, monkeypatch, use_yaml):
+        if not use_yaml:
+            monkeypatch.setattr(config_module, "yaml", None)
+        # Writes must not depend on the locale encoding (e.g. cp1252 on Windows)
+        write_text = config_module.Path.write_text
+        
+        def utf8_only_write_text(self, data, encoding=None, *args, **kwargs):
+            if encoding is None:
+                pytest.fail(f"locale-encoded write to {self}")
+            return write_text(self, data, encoding, *args, **kwargs)
+        
+        monkeypatch.setattr(config_module.Path, "write_text", utf8_only_write_text)
+        path = tmp_path / "config.yaml"
+        config = Config(str(path))
+        config.obsidian_vault = "/home/zoë/Notizen – Ω"
+        config.save()
+        
+        reloaded = Config(str(path))
+        assert reloaded.obsidian_vault == "/home/zoë/Notizen – Ω"
+    
+    def test_reload_reuses_parse_until_file_changes(self, tmp_path, monkeypatch):
+        path = tmp_path / "config.yaml"
+        Config(str(path))
+        
+        calls = []
+        original = Config._parse_yaml
+        monkeypatch.setattr(Config, "_parse_yaml", lambda self, content: calls.append(1) or original(self, content))
+        
+        first = Config(str(path))
+        first.max_results = 99  # must not leak into the cached parse
+        second = Config(str(path))
+        assert len(calls) == 1
+        assert second.max_results == 15
+        
+        path.write_text(path.read_text() + "\ncache_hours: 48\n")
+        assert Config(str(path)).cache_hours == 48
+        assert len(calls) == 2
+    
+    def test_sidecar_json_reused_across_processes(self, tmp_path, monkeypatch):
+        path = tmp_path / "config.yaml"
+        path.write_text(Config.DEFAULT_CONFIG.replace("max_results: 15", "max_results: 7"))
+        assert Config(str(path)).max_results == 7
+        sidecar = tmp_path / "config.yaml.cache.json"
+        assert sidecar.exists()
+        
+        # A fresh process has an empty in-memory cache but should skip YAML
+        monkeypatch.setattr(config_module, "_PARSE_CACHE", config_module.OrderedDict())
+        monkeypatch.setattr(Config, "_parse_yaml", lambda self, content: pytest.fail("YAML re-parsed"))
+        assert Config(str(path)).max_results == 7
+    
+    def test_parse_deferred_until_first_access(self, tmp_path, monkeypatch):
+        path = tmp_path / "config.yaml"
+        path.write_text(Config.DEFAULT_CONFIG.replace("max_results: 15", "max_results: 3"))
+        monkeypatch.setattr(Config, "_load_parsed", lambda self, path, st: pytest.fail("parsed eagerly"))
+        config = Config(str(path))
+        
+        monkeypatch.undo()
+        assert config.max_results == 3
+    
+    def test_obsidian_vault_expanded_and_refreshed(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        config = Config(str(tmp_path / "config.yaml"))
+        assert config.obsidian_vault == str(tmp_path / "SynapseNotes")
+        
+        config.obsidian_vault = "~/Vault"
+        assert config.obsidian_vault == str(tmp_path / "Vault")
+    
+    def test_corrupt_sidecar_is_ignored(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text(Config.DEFAULT_CONFIG)
+        (tmp_path / "config.yaml.cache.json").write_text("{not json")
+        assert Config(str(path)).max_results == 15
+    
+    def test_backslash_path_in_double_quotes_falls_back(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text(Config.DEFAULT_CONFIG.replace('"~/SynapseNotes"', r'"C:\Users\me\Notes"'))
+        config = Config(str(path))
+        assert config.obsidian_vault == r"C:\Users\me\Notes"
+        assert config.default_sources == ["arxiv", "semantic_scholar"]
+        assert config.max_results == 15
+    
+    def test_non_mapping_document_falls_back(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text("- arxiv\n- pubmed\n")
+        config = Config(str(path))
+        assert config.default_sources == ["arxiv"]
+        assert config.max_results == 15
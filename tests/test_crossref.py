@@ -1,7 +1,8 @@
 """Test cross-reference engine."""
 import pytest
+from synapsescanner import crossref
 from synapsescanner.sources import Paper
-from synapsescanner.crossref import find_connections
+from synapsescanner.crossref import find_citation_trails, find_connections
 
 
 class TestCrossRef:
@@ -44,3 +45,70 @@ class TestCrossRef:
         assert connections[0].paper_a.id == "1"
         assert connections[0].paper_b.id == "2"
         assert "john smith" in connections[0].reason.lower()
+    
+    def test_find_connections_keywords_and_titles(self):
+        paper1 = Paper(
+            id="1",
+            title="Quantum Error Correction Study",
+            keywords=["Qubits", "Surface Code", "Decoding"],
+            source="arxiv"
+        )
+        paper2 = Paper(
+            id="2",
+            title="The Error Correction Frontier",
+            keywords=["qubits", "surface code", "decoding"],
+            source="semantic_scholar"
+        )
+        
+        connections = find_connections([paper1, paper2])
+        
+        assert len(connections) == 1
+        assert connections[0].strength == 5
+        assert "Shared keywords" in connections[0].reason
+        assert "Similar topics" in connections[0].reason
+    
+    def test_find_connections_same_source_ignored(self):
+        paper1 = Paper(id="1", title="A", authors=["John Smith"], source="arxiv")
+        paper2 = Paper(id="2", title="B", authors=["John Smith"], source="arxiv")
+        assert find_connections([paper1, paper2]) == []
+    
+    def test_find_connections_top_k(self):
+        papers = [
+            Paper(id=str(i), title=f"T{i}", authors=["Ada"] + ["Bo"] * (i % 2),
+                  source="arxiv" if i < 3 else "semantic_scholar")
+            for i in range(6)
+        ]
+        
+        everything = find_connections(papers)
+        top = find_connections(papers, top_k=2)
+        
+        assert len(everything) == 9
+        assert top == everything[:2]
+        assert all(c.strength == 6 for c in top)
+    
+    def test_large_vocabulary_matches_bitmask_path(self, monkeypatch):
+        papers = [
+            Paper(id=str(i), title=f"Error Correction T{i % 4}", authors=[f"A{i % 3}", "Ada"],
+                  keywords=["qubits", "surface code", f"k{i % 2}", "decoding"],
+                  source=("arxiv", "pubmed", "semantic_scholar")[i % 3])
+            for i in range(9)
+        ]
+        with_bits = find_connections(papers)
+        
+        # Force the set-intersection path used for sparse corpora
+        monkeypatch.setattr(crossref, "_MAX_BITMASK_VOCAB", 0)
+        assert find_connections(papers) == with_bits
+        assert with_bits
+    
+    def test_find_citation_trails(self):
+        cited = Paper(id="2401.00001", title="Cited", source="arxiv")
+        citing = Paper(
+            id="abc",
+            title="Citing",
+            references=["2401.00001", "missing"],
+            source="semantic_scholar"
+        )
+        
+        trails = find_citation_trails([cited, citing])
+        
+        assert trails == [(citing, cited)]
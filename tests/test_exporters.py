@@ -0,0 +1,61 @@
+"""Test export modules."""
+import json
+from synapsescanner.sources import Paper, Connection
+from synapsescanner.exporters.json import JSONExporter
+from synapsescanner.exporters.obsidian import ObsidianExporter
+
+
+class TestObsidianExporter:
+    """Test Obsidian markdown export."""
+    
+    def test_export_writes_papers_and_connections(self, tmp_path):
+        paper1 = Paper(id="1", title="Quantum Sensing", authors=["Ada"], source="arxiv")
+        paper2 = Paper(id="2", title="Optical Clocks", authors=["Ada"], source="semantic_scholar")
+        connection = Connection(paper_a=paper1, paper_b=paper2, strength=3,
+                                reason="Shared authors: ada")
+        
+        exporter = ObsidianExporter(str(tmp_path))
+        result = exporter.export([paper1, paper2], [connection], "quantum")
+        
+        assert result == f"Exported 3 files to {tmp_path}"
+        note = (tmp_path / "quantum_sensing.md").read_bytes().decode("utf-8")
+        assert note.startswith('---\ntitle: "Quantum Sensing"\n')
+        assert "\r\n" not in note
+        connections = (tmp_path / "connections_quantum.md").read_text(encoding="utf-8")
+        assert "Quantum Sensing ↔ Optical Clocks" in connections
+    
+    def test_export_duplicate_titles_keep_last(self, tmp_path):
+        papers = [
+            Paper(id=str(i), title="Same Title", abstract=f"Abstract {i}", source="arxiv")
+            for i in range(5)
+        ]
+        
+        ObsidianExporter(str(tmp_path)).export(papers)
+        
+        assert [p.name for p in tmp_path.iterdir()] == ["same_title.md"]
+        assert "Abstract 4" in (tmp_path / "same_title.md").read_text(encoding="utf-8")
+    
+    def test_escape_yaml(self):
+        exporter = ObsidianExporter("unused")
+        assert exporter._escape_yaml('say "hi"') == 'say \\"hi\\"'
+        assert exporter._escape_yaml('a\\b') == 'a\\\\b'
+
+
+class TestJSONExporter:
+    """Test JSON export."""
+    
+    def test_export_with_connections(self):
+        paper1 = Paper(id="1", title="A", authors=["Ada"], source="arxiv")
+        paper2 = Paper(id="2", title="B", authors=["Ada"], source="semantic_scholar")
+        connections = [
+            Connection(paper_a=paper1, paper_b=paper2, strength=3, reason="Shared authors: ada"),
+            Connection(paper_a=paper1, paper_b=paper2, strength=2, reason="again"),
+        ]
+        
+        data = json.loads(JSONExporter().export([paper1, paper2], connections))
+        
+        assert data["count"] == 2
+        assert data["papers"] == [paper1.to_dict(), paper2.to_dict()]
+        assert data["connection_count"] == 2
+        assert data["connections"][1]["paper_a"] == paper1.to_dict()
+        assert data["connections"][1]["paper_b"] == paper2.to_dict()